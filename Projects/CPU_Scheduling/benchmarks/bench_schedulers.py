@@ -0,0 +1,161 @@
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import SCHEDULERS, load_config, parse_arguments
+from utils.local_api import LocalAPIUtils
+from utils.logger import NullLogger
+
+DEFAULT_SCHEDULERS = "FCFS,RoundRobin,PriorityScheduling,MLFQScheduler"
+DEFAULT_SIZES = "100,1000,10000"
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "myConfig.json")
+
+# Metrics compared against the baseline: name -> True when higher is better
+COMPARED = {"ticks_per_sec": True, "us_per_job": False, "peak_kib": False}
+
+# Wall-clock metrics, only gated for cases that run long enough to be timed reliably
+TIMED = ("ticks_per_sec", "us_per_job")
+
+
+def run_once(config, sched, seed):
+    """
+    Run one headless simulation on the offline backend.
+    Returns:
+        tuple: (simulated ticks, wall time in seconds) of run_simulation alone.
+    """
+    api = LocalAPIUtils(config)
+    session_data = api.init_session(seed=seed)
+    scheduler = SCHEDULERS[sched](config=config, api=api, logger=NullLogger())
+    start = time.perf_counter()
+    summary = scheduler.run_simulation(session_data["session_id"], session_data["start_clock"], session_data["time_slice"])
+    return summary["ticks"], time.perf_counter() - start
+
+
+def measure_memory(config, sched, seed):
+    """
+    Run the simulation again under tracemalloc.
+    Returns:
+        tuple: (peak traced KiB, memory blocks still allocated after the run).
+        CPython has no counter of every allocation, so the retained block
+        count is what we track for allocation growth.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    run_once(config, sched, seed)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return peak / 1024, retained
+
+
+def bench(config, sched, jobs, seed, repeat):
+    """
+    Benchmark one scheduler on a fixed workload of `jobs` jobs.
+    The timing is the median of `repeat` runs, taken without tracemalloc,
+    which slows the simulation down several times; `spread` is the range of
+    the runs relative to that median.
+    Returns:
+        dict: ticks, wall_time, spread, ticks_per_sec, us_per_job, peak_kib and retained_blocks.
+    """
+    run_config = dict(config, min_jobs=jobs, max_jobs=jobs, seed=seed, headless=True)
+    runs = [run_once(run_config, sched, seed) for _ in range(repeat)]
+    ticks = runs[0][0]
+    wall_times = [wall_time for _, wall_time in runs]
+    wall_time = statistics.median(wall_times)
+    peak_kib, retained = measure_memory(run_config, sched, seed)
+    return {
+        "ticks": ticks,
+        "wall_time": wall_time,
+        "spread": (max(wall_times) - min(wall_times)) / wall_time,
+        "ticks_per_sec": ticks / wall_time,
+        "us_per_job": wall_time / jobs * 1e6,
+        "peak_kib": peak_kib,
+        "retained_blocks": retained,
+    }
+
+
+def compare(results, baseline, tolerance, min_time):
+    """
+    Print how every result moved against the baseline.
+    Timings of cases whose median run is shorter than `min_time` seconds are
+    mostly noise and only printed; for the others the allowed change is
+    `tolerance` or twice the larger run-to-run spread, whichever is wider.
+    Returns:
+        int: Number of metrics that got worse by more than allowed.
+    """
+    regressions = 0
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        old_result = baseline[key]
+        timed = min(old_result.get("wall_time", min_time), result["wall_time"]) >= min_time
+        noise = 2 * max(old_result.get("spread", 0), result["spread"])
+        for name, higher_is_better in COMPARED.items():
+            old, new = old_result[name], result[name]
+            if not old:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            allowed = max(tolerance, noise) if name in TIMED else tolerance
+            if worse <= allowed:
+                continue
+            if name in TIMED and not timed:
+                print(f"(untimed) {key} {name}: {old:.2f} -> {new:.2f} ({change:+.1%}), runs under {min_time * 1000:.0f} ms")
+                continue
+            regressions += 1
+            print(f"REGRESSION {key} {name}: {old:.2f} -> {new:.2f} ({change:+.1%}, allowed {allowed:.0%})")
+    return regressions
+
+
+def main():
+    args = parse_arguments(sys.argv)
+    config = load_config(args.get("config", CONFIG_PATH))
+    config["cpus"] = int(args.get("cpus", 2))
+    config["ios"] = int(args.get("ios", 2))
+    scheds = args.get("sched", DEFAULT_SCHEDULERS).split(",")
+    sizes = [int(size) for size in args.get("jobs", DEFAULT_SIZES).split(",")]
+    seed = int(args.get("seed", 5143))
+    repeat = int(args.get("repeat", 5))
+    baseline_path = args.get("baseline", "bench_baseline.json")
+    tolerance = float(args.get("tolerance", 0.15))
+    min_time = float(args.get("min_time", 0.1))  # Shortest median run, in seconds, whose timings are gated
+
+    for sched in scheds:
+        if sched not in SCHEDULERS:
+            print(f"Error: Unsupported scheduler '{sched}'. Supported schedulers: {', '.join(SCHEDULERS.keys())}")
+            sys.exit(1)
+
+    print(f"{'scheduler':>20} {'jobs':>8} {'ticks':>10} {'ticks/s':>12} {'us/job':>10} {'peak KiB':>10} {'retained':>9}")
+    results = {}
+    for sched in scheds:
+        for jobs in sizes:
+            result = bench(config, sched, jobs, seed, repeat)
+            results[f"{sched}/{jobs}"] = result
+            print(
+                f"{sched:>20} {jobs:>8} {result['ticks']:>10} {result['ticks_per_sec']:>12.0f} "
+                f"{result['us_per_job']:>10.1f} {result['peak_kib']:>10.1f} {result['retained_blocks']:>9}"
+            )
+
+    # --save records a new baseline; otherwise compare against the saved one
+    if args.get("save"):
+        with open(baseline_path, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+        print(f"Saved baseline to {baseline_path}")
+    elif os.path.exists(baseline_path):
+        with open(baseline_path) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), tolerance, min_time)
+        print(f"{regressions} regression(s) beyond {tolerance:.0%} against {baseline_path}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import math
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import SCHEDULERS, load_config, parse_arguments
+from scheduler.batched import BatchedSimulator
+from sweep import run_combination
+from utils.checkpoint import load_checkpoint
+from utils.local_api import LocalAPIUtils
+from utils.logger import NullLogger
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "myConfig.json")
+CHECKS = "skip,resume,batched"
+
+
+def simulate(config, sched, seed, skip=True):
+    """
+    Run one headless simulation on the offline backend.
+    Returns:
+        tuple: (summary, engine).
+    """
+    api = LocalAPIUtils(config)
+    session_data = api.init_session(seed=seed)
+    scheduler = SCHEDULERS[sched](config=config, api=api, logger=NullLogger())
+    if not skip:
+        scheduler._skip_idle_ticks = lambda session_id, clock: 0  # Simulate every tick
+    summary = scheduler.run_simulation(session_data["session_id"], session_data["start_clock"], session_data["time_slice"])
+    return summary, scheduler
+
+
+def differences(expected, actual):
+    """Keys whose values differ between two summaries (floats up to rounding)."""
+    return [
+        key for key, value in expected.items()
+        if not (value == actual.get(key) or (
+            isinstance(value, float) and math.isclose(value, actual.get(key, math.nan), rel_tol=1e-9, abs_tol=1e-9)
+        ))
+    ]
+
+
+def check_skip(config, seeds):
+    """Idle-tick skipping gives the same summary as simulating every tick, for every scheduler."""
+    for sched in SCHEDULERS:
+        for per_cpu in (False, True):
+            run_config = dict(config, per_cpu_queues=per_cpu)
+            for seed in seeds:
+                skipped, _ = simulate(run_config, sched, seed)
+                ticked, _ = simulate(run_config, sched, seed, skip=False)
+                yield f"{sched} per_cpu={per_cpu} seed={seed}", differences(ticked, skipped)
+
+
+def check_resume(config, seeds):
+    """A run resumed from a mid-run checkpoint ends with the same summary as an uninterrupted one."""
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        path = os.path.join(checkpoint_dir, "run.ckpt")
+        for sched in SCHEDULERS:
+            for seed in seeds:
+                full, _ = simulate(config, sched, seed)
+                # Checkpoint about halfway; the file keeps the last checkpoint before the end
+                simulate(dict(config, checkpoint=path, checkpoint_every=max(full["ticks"] // 2, 1)), sched, seed)
+                checkpoint = load_checkpoint(path)
+                scheduler = checkpoint["engine"]
+                scheduler.config.pop("checkpoint")
+                api = LocalAPIUtils(scheduler.config)
+                api.import_session(checkpoint["session_id"], checkpoint["api_state"])
+                scheduler.attach(api, NullLogger())
+                resumed = scheduler.resume_simulation(checkpoint["session_id"], checkpoint["clock"])
+                yield f"{sched} seed={seed} from clock {checkpoint['clock']}", differences(full, resumed)
+
+
+def check_batched(config, seeds):
+    """BatchedSimulator gives every seed the summary of a per-seed engine run."""
+    for sched in BatchedSimulator.SCHEDULERS:
+        for quantum in (None, 3) if sched == "RoundRobin" else (None,):
+            rows = BatchedSimulator(config, seeds, sched, quantum).run()
+            for seed, row in zip(seeds, rows):
+                run = {"sched": sched, "cpus": config["cpus"], "ios": config["ios"], "quantum": quantum, "seed": seed}
+                expected = run_combination(config, "local", run)
+                yield f"{sched} quantum={quantum} seed={seed}", differences({key: expected[key] for key in row}, row)
+
+
+def main():
+    args = parse_arguments(sys.argv)
+    config = load_config(args.get("config", CONFIG_PATH))
+    config["cpus"] = int(args.get("cpus", 2))
+    config["ios"] = int(args.get("ios", 2))
+    config["headless"] = True
+    if "jobs" in args:
+        config["min_jobs"] = config["max_jobs"] = int(args["jobs"])
+    seeds = list(range(1, int(args.get("seeds", 20)) + 1))
+    checks = {"skip": check_skip, "resume": check_resume, "batched": check_batched}
+
+    failures = 0
+    for name in args.get("checks", CHECKS).split(","):
+        if name not in checks:
+            print(f"Error: Unsupported check '{name}'. Supported checks: {', '.join(checks)}")
+            sys.exit(1)
+        cases = 0
+        for case, mismatched in checks[name](config, seeds):
+            cases += 1
+            if mismatched:
+                failures += 1
+                print(f"MISMATCH {name}: {case}: {', '.join(mismatched)}")
+        print(f"{name}: {cases} case(s) checked")
+
+    print(f"{failures} mismatch(es)")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler.job import Job
+from scheduler.priority import PriorityPolicy
+
+
+class SortedListPolicy(PriorityPolicy):
+    """The previous READY queue: re-sort the list on every append, pop from the front."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.ready_queue = []
+
+    def preload(self, jobs):
+        self.ready_queue.extend(jobs)
+        self.ready_queue.sort(key=lambda x: x.priority)
+
+    def enqueue(self, job, clock):
+        self.ready_queue.append(job)
+        self.ready_queue.sort(key=lambda x: x.priority)
+
+    def select_next(self, cpu_index, clock):
+        self.ready_queue.sort(key=lambda x: x.priority)
+        return self.ready_queue.pop(0)
+
+
+def time_dispatch(policy_class, queue_size, operations, rng):
+    """
+    Fill the READY queue to `queue_size` jobs, then time `operations` dispatch
+    cycles (select_next + enqueue) at that size.
+    Returns:
+        float: Microseconds per dispatch cycle.
+    """
+    policy = policy_class({"priority_levels": [1, 2, 3, 4, 5]})
+    jobs = [Job(job_id, priority=rng.randint(1, 5)) for job_id in range(queue_size)]
+    if hasattr(policy, "preload"):
+        policy.preload(jobs)  # Filling the sorted list one append at a time would be O(n^2 log n)
+    else:
+        for job in jobs:
+            policy.enqueue(job, 0)
+
+    start = time.perf_counter()
+    for clock in range(operations):
+        job = policy.select_next(0, clock)
+        policy.enqueue(job, clock)
+    return (time.perf_counter() - start) / operations * 1e6
+
+
+def main():
+    rng = random.Random(5143)
+    sizes = [100, 1_000, 10_000, 100_000]
+
+    print(f"{'ready jobs':>10} {'heap (us/op)':>14} {'sorted list (us/op)':>20}")
+    for size in sizes:
+        heap_cost = time_dispatch(PriorityPolicy, size, 20_000, rng)
+        # The sorted list is O(n log n) per cycle, so keep its sample small
+        list_cost = time_dispatch(SortedListPolicy, size, max(20, 200_000 // size), rng)
+        print(f"{size:>10} {heap_cost:>14.2f} {list_cost:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,47 @@ import sys
 import json
 import random
 from utils.api_utils import APIUtils
+from utils.local_api import LocalAPIUtils
+from utils.async_api_utils import ConcurrentAPIUtils
+from utils.trace_cache import RecordingAPIUtils, ReplayAPIUtils
 from utils.logger import Logger
+from utils.checkpoint import load_checkpoint
 from scheduler.fcfs import FCFS
 from scheduler.rr import RoundRobin
 from scheduler.mlfb import MLFQScheduler
 from scheduler.priority import PriorityScheduling
+from scheduler.sjf import SJF, SRTF
+
+# Schedulers selectable with sched=
+SCHEDULERS = {
+    "FCFS": FCFS,
+    "RoundRobin": RoundRobin,
+    "MLFQScheduler": MLFQScheduler,
+    "PriorityScheduling": PriorityScheduling,
+    "SJF": SJF,
+    "SRTF": SRTF
+}
+
+# Job sources selectable with backend=: the remote API or the in-process generator
+BACKENDS = {
+    "remote": APIUtils,
+    "async": ConcurrentAPIUtils,
+    "local": LocalAPIUtils
+}
 
 
 def parse_arguments(argv):
     """
     Parse command-line arguments and return them as a dictionary.
+    key=value arguments keep their value, --flag arguments are set to True.
     """
     args = {}
     for arg in argv[1:]:
         if "=" in arg:
             key, value = arg.split("=")
             args[key] = value
+        elif arg.startswith("--"):
+            args[arg[2:]] = True
     return args
 
 def load_config(config_path):
@@ -31,22 +56,95 @@ def load_config(config_path):
         print(f"Error: Config file '{config_path}' not found.")
         sys.exit(1)
 
+def apply_run_options(config, args):
+    """
+    Apply the command-line options that only change how a run is shown,
+    recorded and saved, not what it simulates; resumed runs take them afresh.
+    """
+    config["headless"] = args.get("headless", False)  # Skip the live table and per-tick logging
+    config["profile"] = args.get("profile", False)  # Time each tick-loop phase and count its API calls
+    if "timeline" in args:
+        config["timeline"] = args["timeline"]  # Stream job state transitions to a .csv or binary timeline
+    if "fps" in args:
+        config["fps"] = float(args["fps"])  # Redraw the live table at this frame rate instead of every tick
+    if "checkpoint" in args:
+        config["checkpoint"] = args["checkpoint"]  # Save the simulation state here on SIGINT
+    if "checkpoint_every" in args:
+        config["checkpoint_every"] = int(args["checkpoint_every"])  # ...and every this many ticks
+
+def run(scheduler, session_id, clock, time_slice=None, resume=False):
+    """Run (or resume) the simulation, exiting cleanly if it is interrupted."""
+    try:
+        if resume:
+            scheduler.resume_simulation(session_id, clock)
+        else:
+            scheduler.run_simulation(session_id, clock, time_slice)
+    except KeyboardInterrupt:
+        checkpoint = scheduler.config.get("checkpoint")
+        if checkpoint:
+            print(f"Interrupted. Resume with: python3 main.py resume={checkpoint}")
+        sys.exit(130)
+
+def resume(args):
+    """Continue a simulation from the checkpoint given with resume=."""
+    try:
+        checkpoint = load_checkpoint(args["resume"])
+    except RuntimeError as e:
+        print(f"Error loading checkpoint: {str(e)}")
+        sys.exit(1)
+
+    scheduler = checkpoint["engine"]
+    config = scheduler.config
+    for option in ("timeline", "fps", "checkpoint", "checkpoint_every"):
+        config.pop(option, None)  # Never append to the original run's timeline or overwrite its checkpoint
+    apply_run_options(config, args)
+
+    # Local sessions are restored from the checkpoint, remote ones continue on the server
+    backend = args.get("backend", "remote")
+    if checkpoint["api_state"] is not None:
+        backend = "local"
+        api = LocalAPIUtils(config)
+        api.import_session(checkpoint["session_id"], checkpoint["api_state"])
+    elif backend in BACKENDS:
+        api = BACKENDS[backend](config)
+    else:
+        print(f"Error: Unsupported backend '{backend}'. Supported backends: {', '.join(BACKENDS.keys())}")
+        sys.exit(1)
+
+    if checkpoint.get("prefetched"):
+        api.import_prefetched(checkpoint["session_id"], checkpoint["prefetched"])  # Already drained from the server
+    scheduler.attach(api, Logger(verbose=not config["headless"]))
+    print(f"Resuming session {checkpoint['session_id']} at clock {checkpoint['clock']}.")
+    run(scheduler, checkpoint["session_id"], checkpoint["clock"], resume=True)
+
+    if backend in ("remote", "async"):
+        api.close()
+
 def main():
     # Parse command-line arguments
     args = parse_arguments(sys.argv)
 
+    if "resume" in args:
+        resume(args)
+        return
+
     # Ensure required arguments are provided
     required_args = ["sched", "cpus", "ios", "config"]
     for arg in required_args:
         if arg not in args:
             print(f"Error: Missing required argument '{arg}'")
-            print("Usage: python3 main.py sched=FCFS cpus=2 ios=2 config=config/myConfig.json [seed=12345]")
+            print("Usage: python3 main.py sched=FCFS cpus=2 ios=2 config=config/myConfig.json [seed=12345] [backend=remote|async|local] [trace=record|replay] [trace_dir=traces] [--headless | fps=10] [--per_cpu] [--prefetch] [--profile] [timeline=run.csv|run.tl] [checkpoint=run.ckpt [checkpoint_every=10000]]")
+            print("       python3 main.py resume=run.ckpt [--headless | fps=10] [--profile] [timeline=...] [checkpoint=...]")
             sys.exit(1)
 
     # Load the configuration from the JSON file
     config = load_config(args["config"])
     config["cpus"] = int(args["cpus"])  # Number of CPUs
     config["ios"] = int(args["ios"])    # Number of IO devices
+    config["per_cpu_queues"] = args.get("per_cpu", False)  # One run queue per CPU with work stealing
+    if args.get("prefetch"):
+        config["prefetch_bursts"] = True  # Fetch each job's remaining bursts in the background on arrival
+    apply_run_options(config, args)
 
     # Extract optional seed from arguments
     seed = int(args["seed"]) if "seed" in args else None
@@ -57,8 +155,26 @@ def main():
     if seed:
         random.seed(seed)
 
-    # Initialize the APIUtils with the configuration
-    api = APIUtils(config)
+    # Select the job source
+    backend = args.get("backend", "remote")
+    if backend not in BACKENDS:
+        print(f"Error: Unsupported backend '{backend}'. Supported backends: {', '.join(BACKENDS.keys())}")
+        sys.exit(1)
+
+    # Initialize the API backend with the configuration, optionally recording
+    # the session to a trace file or replaying a recorded one from disk
+    trace = args.get("trace")
+    trace_dir = args.get("trace_dir", "traces")
+    if trace == "replay":
+        backend = "replay"
+        api = ReplayAPIUtils(config, trace_dir)
+    elif trace == "record":
+        api = RecordingAPIUtils(BACKENDS[backend](config), trace_dir)
+    elif trace is None:
+        api = BACKENDS[backend](config)
+    else:
+        print(f"Error: Unsupported trace mode '{trace}'. Supported modes: record, replay")
+        sys.exit(1)
 
     # Initialize the session with the API
     try:
@@ -72,34 +188,29 @@ def main():
         sys.exit(1)
 
     # Dynamically select the scheduler
-    schedulers = {
-        "FCFS": FCFS,
-        "RoundRobin": RoundRobin,
-        "MLFQScheduler": MLFQScheduler,
-        "PriorityScheduling": PriorityScheduling
-    }
-
-    if args["sched"] not in schedulers:
-        print(f"Error: Unsupported scheduler '{args['sched']}'. Supported schedulers: {', '.join(schedulers.keys())}")
+    if args["sched"] not in SCHEDULERS:
+        print(f"Error: Unsupported scheduler '{args['sched']}'. Supported schedulers: {', '.join(SCHEDULERS.keys())}")
         sys.exit(1)
 
     # Initialize the Scheduler
-    scheduler_class = schedulers[args["sched"]]
+    scheduler_class = SCHEDULERS[args["sched"]]
     scheduler = scheduler_class(
         config=config,
         api=api,
-        logger=Logger(),
+        logger=Logger(verbose=not config["headless"]),
     )
     
     # Run the simulation
-    if args["sched"] == "FCFS":
-        scheduler.run_simulation(session_id, start_clock)
-    elif args["sched"] == "RoundRobin":
-        scheduler.run_simulation(session_id, start_clock, time_slice)
-    elif args["sched"] == "PriorityScheduling":
-        scheduler.run_simulation(session_id, start_clock)
-    elif args["sched"] == "MLFQScheduler":
-        scheduler.run_simulation(session_id, start_clock)
+    run(scheduler, session_id, start_clock, time_slice)
+
+    if trace == "record":
+        print(f"Recorded session trace to {api.save()}")
+
+    # Report API traffic and release pooled connections for remote-backed runs
+    if backend in ("remote", "async"):
+        stats = api.stats
+        print(f"API round-trips: {stats['round_trips']}, bytes sent: {stats['bytes_sent']}, bytes received: {stats['bytes_received']}")
+        api.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,145 @@
+import csv
+import itertools
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from main import SCHEDULERS, BACKENDS, parse_arguments, load_config
+from sweep import RESULT_COLUMNS, parse_list, run_combination
+
+# Two-sided 95% critical values of Student's t distribution by degrees of freedom;
+# past the table the normal value 1.96 is close enough
+T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228,
+    11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093,
+    20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048,
+    29: 2.045, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980,
+}
+
+DEFAULT_METRICS = "avg_turnaround,avg_waiting,avg_response"
+
+
+def t_critical(df):
+    """95% two-sided t value for `df` degrees of freedom, rounded towards the safer (larger) table entry."""
+    for table_df in sorted(T_95):
+        if df <= table_df:
+            return T_95[table_df]
+    return 1.96
+
+
+def confidence_interval(values):
+    """
+    Mean of `values` and the half-width of its 95% confidence interval.
+    Returns:
+        tuple: (mean, half_width); the half-width is inf with fewer than two values.
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return (float(values.mean()) if len(values) else float("nan")), math.inf
+    half_width = t_critical(len(values) - 1) * values.std(ddof=1) / math.sqrt(len(values))
+    return float(values.mean()), float(half_width)
+
+
+def converged(rows, metrics, rel_width, min_runs):
+    """True once every metric's interval half-width is within `rel_width` of its mean."""
+    if len(rows) < min_runs:
+        return False
+    for metric in metrics:
+        mean, half_width = confidence_interval([row[metric] for row in rows])
+        if half_width > rel_width * abs(mean):
+            return False
+    return True
+
+
+def report(results, metrics):
+    """Print each scheduler's means with their intervals, then the paired differences to the first scheduler."""
+    for sched, rows in results.items():
+        print(f"{sched} ({len(rows)} seeds)")
+        for metric in metrics:
+            mean, half_width = confidence_interval([row[metric] for row in rows])
+            print(f"  {metric:>16}: {mean:10.3f} ± {half_width:8.3f}  [{mean - half_width:.3f}, {mean + half_width:.3f}]")
+
+    # Every scheduler ran the same seeds (same workloads), so compare them seed by seed
+    baseline, *others = results
+    for sched in others:
+        by_seed = {row["seed"]: row for row in results[baseline]}
+        pairs = [(by_seed[row["seed"]], row) for row in results[sched] if row["seed"] in by_seed]
+        print(f"{sched} - {baseline} ({len(pairs)} paired seeds)")
+        for metric in metrics:
+            mean, half_width = confidence_interval([row[metric] - base[metric] for base, row in pairs])
+            verdict = "no significant difference" if abs(mean) <= half_width else ("lower" if mean < 0 else "higher")
+            print(f"  {metric:>16}: {mean:+10.3f} ± {half_width:8.3f}  ({verdict})")
+
+
+def main():
+    args = parse_arguments(sys.argv)
+    if "config" not in args:
+        print("Error: Missing required argument 'config'")
+        print(
+            "Usage: python3 montecarlo.py config=config/myConfig.json [sched=RoundRobin,MLFQScheduler] [cpus=2] [ios=2] "
+            "[quantum=4] [seeds=200] [first_seed=1] [min_seeds=10] [rel_width=0.05] [metrics=avg_turnaround,avg_waiting] "
+            "[backend=local] [workers=4] [out=montecarlo_results.csv]"
+        )
+        sys.exit(1)
+
+    config = load_config(args["config"])
+    backend = args.get("backend", "local")
+    if backend not in BACKENDS:
+        print(f"Error: Unsupported backend '{backend}'. Supported backends: {', '.join(BACKENDS.keys())}")
+        sys.exit(1)
+    scheds = parse_list(args.get("sched", "RoundRobin,MLFQScheduler"))
+    for sched in scheds:
+        if sched not in SCHEDULERS:
+            print(f"Error: Unsupported scheduler '{sched}'. Supported schedulers: {', '.join(SCHEDULERS.keys())}")
+            sys.exit(1)
+    metrics = parse_list(args.get("metrics", DEFAULT_METRICS))
+    for metric in metrics:
+        if metric not in RESULT_COLUMNS:
+            print(f"Error: Unsupported metric '{metric}'. Supported metrics: {', '.join(RESULT_COLUMNS[5:])}")
+            sys.exit(1)
+
+    max_seeds = int(args.get("seeds", 200))  # Upper bound on runs per scheduler
+    min_seeds = int(args.get("min_seeds", 10))  # Runs before the stopping rule is checked
+    rel_width = float(args.get("rel_width", 0.05))  # Stop when every 95% CI half-width is within this share of its mean
+    quantum = int(args["quantum"]) if "quantum" in args else None
+    workers = int(args.get("workers", os.cpu_count() or 1))
+    seeds = itertools.count(int(args.get("first_seed", 1)))
+
+    results = {sched: [] for sched in scheds}
+    active = list(scheds)
+    start = time.perf_counter()
+    print(f"Running up to {max_seeds} seeds per scheduler on {workers} workers...")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # One batch of seeds per round, run by every scheduler that has not converged,
+        # so the schedulers keep being compared on the same workloads
+        while active:
+            done = len(results[active[0]])
+            batch = [next(seeds) for _ in range(min(workers, max_seeds - done))]
+            runs = [
+                {"sched": sched, "cpus": int(args.get("cpus", 1)), "ios": int(args.get("ios", 1)), "quantum": quantum, "seed": seed}
+                for sched in active
+                for seed in batch
+            ]
+            for row in executor.map(run_combination, itertools.repeat(config), itertools.repeat(backend), runs):
+                results[row["sched"]].append(row)
+            active = [
+                sched for sched in active
+                if len(results[sched]) < max_seeds and not converged(results[sched], metrics, rel_width, min_seeds)
+            ]
+
+    report(results, metrics)
+    print(f"Finished {sum(len(rows) for rows in results.values())} runs in {time.perf_counter() - start:.2f}s")
+
+    if "out" in args:
+        with open(args["out"], "w", newline="") as results_file:
+            writer = csv.DictWriter(results_file, fieldnames=RESULT_COLUMNS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(row for rows in results.values() for row in rows)
+
+
+if __name__ == "__main__":
+    main()
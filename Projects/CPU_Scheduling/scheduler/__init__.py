@@ -1,7 +1,12 @@
+from .engine import Policy, SchedulerEngine
+from .job import Job
+from .percpu import PerCPUPolicy
 from .fcfs import FCFS
 from .rr import RoundRobin
 from .mlfb import MLFQScheduler
 from .priority import PriorityScheduling
+from .sjf import SJF, SRTF
+from .batched import BatchedSimulator
 
 
-__all__ = ["FCFS", "RoundRobin", "PriorityScheduling", "MLFQScheduler"]
+__all__ = ["Job", "Policy", "PerCPUPolicy", "SchedulerEngine", "FCFS", "RoundRobin", "PriorityScheduling", "MLFQScheduler", "SJF", "SRTF", "BatchedSimulator"]
@@ -0,0 +1,287 @@
+import numpy as np
+
+from utils.local_api import LocalAPIUtils
+
+NEVER = np.iinfo(np.int64).max  # Tick of an event that will not happen
+
+
+class RunQueues:
+    """One FIFO queue of job indices per run, each kept in a ring buffer."""
+
+    def __init__(self, runs, capacity):
+        self.items = np.zeros((runs, capacity), dtype=np.int64)
+        self.head = np.zeros(runs, dtype=np.int64)
+        self.length = np.zeros(runs, dtype=np.int64)
+        self.capacity = capacity  # A job is in at most one queue, so no queue outgrows its run's job count
+
+    def push(self, runs, jobs):
+        """Append every job to its run's queue; jobs of one run are appended in the given order."""
+        if not len(runs):
+            return
+        order = np.argsort(runs, kind="stable")
+        runs, jobs = runs[order], jobs[order]
+        rank = np.arange(len(runs)) - np.searchsorted(runs, runs)  # Position among the jobs pushed to the same run
+        self.items[runs, (self.head[runs] + self.length[runs] + rank) % self.capacity] = jobs
+        np.add.at(self.length, runs, 1)
+
+    def pop(self, runs):
+        """Remove and return the head of each of the (distinct, non-empty) runs' queues."""
+        jobs = self.items[runs, self.head[runs]]
+        self.head[runs] = (self.head[runs] + 1) % self.capacity
+        self.length[runs] -= 1
+        return jobs
+
+
+class BatchedSimulator:
+    """
+    Simulates many independent seeded runs of FCFS or RoundRobin at once.
+
+    Every run draws the same workload as LocalAPIUtils does for its seed and
+    follows the same tick rules as SchedulerEngine, so each run's summary
+    matches a headless run of the scheduler on the local backend. Job state is
+    kept in 2-D (run x job) arrays and each step is a fixed sequence of
+    vectorized operations over all runs, so one process can evaluate a whole
+    seed sweep at once.
+
+    Like the engine, every run skips its idle ticks: runs keep their own
+    clocks, and a step moves each run to the next tick on which its state can
+    change (a dispatch, an arrival or the end of a burst or time slice). A step
+    only touches the device slots and the heads of the READY and WAITING
+    queues, so its cost grows with the number of runs and devices, not with
+    the number of jobs.
+
+    Every step also pays a fixed NumPy overhead, and the batch takes as many
+    steps as its longest run. The batch is only faster than running the
+    engine once per seed with enough runs to amortize that overhead: about
+    MIN_RUNS, whatever the workload size. With fewer seeds it is slower.
+    """
+
+    SCHEDULERS = ("FCFS", "RoundRobin")
+    MIN_RUNS = 40  # Break-even batch size against one engine run per seed, measured from 5 to 1000 jobs per run
+
+    def __init__(self, config, seeds, sched="FCFS", quantum=None):
+        """
+        Args:
+            config (dict): The simulation config; cpus and ios must be set.
+            seeds (list): One run per seed.
+            sched (str): "FCFS" or "RoundRobin".
+            quantum (int, optional): RoundRobin time slice; defaults to each
+                session's time slice, like run_simulation.
+        """
+        if sched not in self.SCHEDULERS:
+            raise ValueError(f"Unsupported scheduler '{sched}'. Supported schedulers: {', '.join(self.SCHEDULERS)}")
+        self.config = config
+        self.seeds = list(seeds)
+        self.sched = sched
+        self.cpus = config["cpus"]
+        self.ios = config["ios"]
+        self._load_workloads(quantum)
+
+    def _load_workloads(self, quantum):
+        """Draw every run's jobs and bursts from LocalAPIUtils into padded arrays."""
+        workloads, time_slices = [], []
+        for seed in self.seeds:
+            api = LocalAPIUtils(self.config)
+            session = api.init_session(seed=seed)
+            workloads.append(list(api.sessions[session["session_id"]]["jobs"]))
+            time_slices.append(session["time_slice"])
+
+        runs = len(workloads)
+        jobs = max((len(workload) for workload in workloads), default=0) or 1
+        bursts = max((len(job_bursts) for workload in workloads for _, _, job_bursts in workload), default=0) or 1
+        self.arrival = np.zeros((runs, jobs), dtype=np.int64)
+        self.job_count = np.zeros(runs, dtype=np.int64)
+        self.burst_count = np.zeros((runs, jobs), dtype=np.int64)
+        self.durations = np.zeros((runs, jobs, bursts), dtype=np.int64)
+        self.is_cpu = np.zeros((runs, jobs, bursts), dtype=bool)
+        for run, workload in enumerate(workloads):
+            self.job_count[run] = len(workload)
+            for index, (arrival_time, _, job_bursts) in enumerate(workload):
+                self.arrival[run, index] = arrival_time
+                self.burst_count[run, index] = len(job_bursts)
+                for burst_index, burst in enumerate(job_bursts):
+                    self.durations[run, index, burst_index] = burst["duration"]
+                    self.is_cpu[run, index, burst_index] = burst["burst_type"] == "CPU"
+        self.valid = np.arange(jobs) < self.job_count[:, None]  # Padding columns are never admitted
+
+        if self.sched == "RoundRobin":
+            self.quantum = np.full(runs, quantum) if quantum is not None else np.array(time_slices, dtype=np.int64)
+        else:
+            self.quantum = None
+
+    def _route(self, runs, jobs, clocks):
+        """Put jobs whose current burst is set on the READY or WAITING queue, in the given order."""
+        cpu_burst = self.is_cpu[runs, jobs, self.burst_index[runs, jobs]]
+        self.queued_at[runs, jobs] = clocks
+        self.ready.push(runs[cpu_burst], jobs[cpu_burst])
+        self.waiting.push(runs[~cpu_burst], jobs[~cpu_burst])
+
+    def _dispatch(self, slots, ends, queue, clocks, alive, cpu):
+        """
+        Give every free slot (CPU or I/O device), in index order, the head of
+        its run's queue, and note the tick on which the job will leave it.
+        """
+        for index in range(slots.shape[1]):
+            take = alive & (slots[:, index] < 0) & (queue.length > 0)
+            if not take.any():
+                continue
+            runs = np.flatnonzero(take)
+            jobs = queue.pop(runs)
+            clock = clocks[runs]
+            slots[runs, index] = jobs
+            self.start[runs, jobs] = clock
+            length = self.burst_left[runs, jobs]
+            if cpu:
+                if self.quantum is not None:
+                    length = np.minimum(length, self.quantum[runs])
+                first = self.first_run[runs, jobs] < 0
+                self.first_run[runs[first], jobs[first]] = clock[first]
+                self.context_switches[runs] += 1
+            else:
+                self.io_wait[runs, jobs] += clock - self.queued_at[runs, jobs]
+            ends[runs, index] = clock + length - 1
+
+    def _release(self, slots, ends, busy, service, clocks):
+        """
+        Free the slots whose burst or time slice ends on their run's current
+        tick: jobs with burst left go back to the READY queue, the others move
+        to their next burst or terminate, in slot order.
+        """
+        leaving = (slots >= 0) & (ends == clocks[:, None])
+        if not leaving.any():
+            return
+        runs, index = np.nonzero(leaving)  # Ordered by run, then by slot
+        jobs = slots[runs, index]
+        clock = clocks[runs]
+        ran = clock - self.start[runs, jobs] + 1  # Credit the ticks the job ran since dispatch
+        service[runs, jobs] += ran
+        busy[runs, index] += ran
+        slots[runs, index] = -1
+        self.burst_left[runs, jobs] -= ran
+
+        completed = self.burst_left[runs, jobs] == 0
+        self.burst_index[runs[completed], jobs[completed]] += 1
+        more = self.burst_index[runs, jobs] < self.burst_count[runs, jobs]  # True for jobs whose time slice ended
+        next_burst = completed & more
+        self.burst_left[runs[next_burst], jobs[next_burst]] = self.durations[
+            runs[next_burst], jobs[next_burst], self.burst_index[runs[next_burst], jobs[next_burst]]
+        ]
+        self.completion[runs[~more], jobs[~more]] = clock[~more] + 1
+        np.add.at(self.done_count, runs[~more], 1)
+        self._route(runs[more], jobs[more], clock[more])
+
+    def run(self):
+        """
+        Simulate every run to completion.
+        Returns:
+            list: One summary dict per seed, with the keys of Metrics.summary()
+            that sweep.py records.
+        """
+        runs, jobs = self.arrival.shape
+        all_runs = np.arange(runs)
+        self.burst_index = np.zeros((runs, jobs), dtype=np.int64)
+        self.burst_left = np.zeros((runs, jobs), dtype=np.int64)  # Duration left of the job's current burst
+        self.start = np.zeros((runs, jobs), dtype=np.int64)
+        self.queued_at = np.zeros((runs, jobs), dtype=np.int64)
+        self.first_run = np.full((runs, jobs), -1, dtype=np.int64)
+        self.completion = np.full((runs, jobs), -1, dtype=np.int64)
+        self.cpu_time = np.zeros((runs, jobs), dtype=np.int64)
+        self.io_time = np.zeros((runs, jobs), dtype=np.int64)
+        self.io_wait = np.zeros((runs, jobs), dtype=np.int64)
+        self.done_count = np.zeros(runs, dtype=np.int64)
+        self.ready = RunQueues(runs, jobs)
+        self.waiting = RunQueues(runs, jobs)
+        cpu_slots = np.full((runs, self.cpus), -1, dtype=np.int64)  # Job on each CPU, -1 when idle
+        cpu_ends = np.zeros((runs, self.cpus), dtype=np.int64)  # Last tick of each CPU's current job
+        io_slots = np.full((runs, self.ios), -1, dtype=np.int64)
+        io_ends = np.zeros((runs, self.ios), dtype=np.int64)
+        self.cpu_busy = np.zeros((runs, self.cpus), dtype=np.int64)
+        self.io_busy = np.zeros((runs, self.ios), dtype=np.int64)
+        self.context_switches = np.zeros(runs, dtype=np.int64)
+        self.ticks = np.zeros(runs, dtype=np.int64)
+
+        # Each run's jobs in (arrival tick, job) order, with a NEVER column past the last one
+        arrival_order = np.argsort(np.where(self.valid, self.arrival, NEVER), axis=1, kind="stable")
+        arrival_times = np.take_along_axis(np.where(self.valid, self.arrival, NEVER), arrival_order, axis=1)
+        arrival_times = np.concatenate([arrival_times, np.full((runs, 1), NEVER)], axis=1)
+        admitted = np.zeros(runs, dtype=np.int64)  # Jobs of each run admitted so far
+
+        alive = self.job_count > 0
+        clocks = np.zeros(runs, dtype=np.int64)  # Each run's current tick
+        while alive.any():
+            # Admit the jobs arriving on each run's tick, one per run at a time to keep their order
+            while True:
+                arriving = alive & (arrival_times[all_runs, admitted] == clocks)
+                if not arriving.any():
+                    break
+                arriving_runs = np.flatnonzero(arriving)
+                arriving_jobs = arrival_order[arriving_runs, admitted[arriving_runs]]
+                admitted[arriving_runs] += 1
+                self.burst_left[arriving_runs, arriving_jobs] = self.durations[arriving_runs, arriving_jobs, 0]
+                self._route(arriving_runs, arriving_jobs, clocks[arriving_runs])
+
+            self._dispatch(cpu_slots, cpu_ends, self.ready, clocks, alive, cpu=True)
+            self._dispatch(io_slots, io_ends, self.waiting, clocks, alive, cpu=False)
+            self._release(cpu_slots, cpu_ends, self.cpu_busy, self.cpu_time, clocks)
+            self._release(io_slots, io_ends, self.io_busy, self.io_time, clocks)
+
+            finished = alive & (self.done_count == self.job_count)
+            self.ticks[finished] = clocks[finished] + 1
+            alive &= ~finished
+
+            # Skip each run to its next tick that can change its state: the next
+            # one if a queued job can be dispatched, else the next arrival or release
+            dispatchable = (self.ready.length > 0) & (cpu_slots < 0).any(axis=1)
+            dispatchable |= (self.waiting.length > 0) & (io_slots < 0).any(axis=1)
+            next_event = np.minimum(
+                np.where(cpu_slots >= 0, cpu_ends, NEVER).min(axis=1, initial=NEVER),
+                np.where(io_slots >= 0, io_ends, NEVER).min(axis=1, initial=NEVER),
+            )
+            next_event = np.minimum(next_event, arrival_times[all_runs, admitted])
+            clocks = np.where(dispatchable, clocks + 1, next_event)
+
+        return self.summaries()
+
+    def summaries(self):
+        """Per-run metrics, computed like Metrics.summary() over each run's completed jobs."""
+        done = self.completion >= 0
+        turnaround = np.where(done, self.completion - self.arrival, 0)
+        waiting = turnaround - self.cpu_time - self.io_time
+        response = self.first_run - self.arrival
+        jobs = done.sum(axis=1)
+        ticks = np.maximum(self.ticks, 1)
+
+        columns = {
+            "jobs": jobs,
+            "ticks": self.ticks,
+            "throughput": jobs / ticks,
+            "context_switches": self.context_switches,
+            "cpu_utilization": (self.cpu_busy / ticks[:, None] * 100).mean(axis=1) if self.cpus else np.zeros(len(jobs)),
+            "io_utilization": (self.io_busy / ticks[:, None] * 100).mean(axis=1) if self.ios else np.zeros(len(jobs)),
+        }
+        dispatched = done & (self.first_run >= 0)  # Response time is undefined for jobs that never ran on a CPU
+        times = (
+            ("turnaround", turnaround, done),
+            ("waiting", waiting, done),
+            ("response", response, dispatched),
+            ("io_wait", self.io_wait, done),
+        )
+        for name, values, mask in times:
+            included = mask.sum(axis=1)
+            counts = np.maximum(included, 1)
+            columns[f"avg_{name}"] = np.where(mask, values, 0).sum(axis=1) / counts
+            # Linear-interpolated percentiles like np.percentile, over each row's included jobs
+            ordered = np.sort(np.where(mask, values, np.iinfo(np.int64).max), axis=1)
+            for percentile in (50, 95, 99):
+                position = (counts - 1) * percentile / 100
+                low = np.floor(position).astype(np.int64)
+                high = np.minimum(low + 1, counts - 1)
+                low_values = np.take_along_axis(ordered, low[:, None], axis=1)[:, 0]
+                high_values = np.take_along_axis(ordered, high[:, None], axis=1)[:, 0]
+                value = low_values + (high_values - low_values) * (position - low)
+                columns[f"p{percentile}_{name}"] = np.where(included > 0, value, 0)
+
+        return [
+            {"seed": seed, **{name: values[run].item() for name, values in columns.items()}}
+            for run, seed in enumerate(self.seeds)
+        ]
@@ -0,0 +1,514 @@
+from collections import deque
+from utils.metrics import Metrics
+from utils.rich_table import RichTable
+from utils.null_table import NullTable
+from utils.timeline import TimelineWriter, NullTimeline
+from utils.profiler import PhaseProfiler, NullProfiler, PHASES
+from utils.checkpoint import InterruptFlag, save_checkpoint
+from scheduler.events import EventQueue
+from scheduler.job import Job
+
+
+class Policy:
+    """
+    Base class for the scheduling policies plugged into SchedulerEngine.
+
+    A policy owns the READY and WAITING queues: the engine hands it every job
+    that becomes ready for a CPU or an I/O device and asks it which job a free
+    device should take next. The defaults are FIFO queues with no preemption.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.ready_queue = deque()
+        self.waiting_queue = deque()
+
+    def start(self, time_slice):
+        """Called once before the simulation starts with the session's time slice."""
+
+    def enqueue(self, job, clock):
+        """Add a job whose next burst is a CPU burst."""
+        self.ready_queue.append(job)
+
+    def select_next(self, cpu_index, clock):
+        """Remove and return the job the free CPU `cpu_index` should run, or None."""
+        return self.ready_queue.popleft() if self.ready_queue else None
+
+    def peek_next(self):
+        """Return the job select_next would remove next without removing it, or None."""
+        return self.ready_queue[0] if self.ready_queue else None
+
+    def quantum(self, job):
+        """Ticks the job may run before it is preempted, or None to run its burst to completion."""
+        return None
+
+    def on_quantum_expire(self, job, clock):
+        """Requeue a job whose quantum ran out before its burst finished."""
+        self.enqueue(job, clock)
+
+    def select_victim(self, running_jobs, clock):
+        """
+        Called while jobs are still READY after the free CPUs were filled. Return
+        the index of the CPU whose job should be preempted for the next READY
+        job, or None to keep every running job.
+        """
+        return None
+
+    def on_preempt(self, job, clock):
+        """Requeue a job taken off its CPU by select_victim before its burst finished."""
+        self.enqueue(job, clock)
+
+    def on_cpu_burst_complete(self, job, clock):
+        """Called when a job finishes a CPU burst, before it moves to its next burst."""
+
+    def on_tick(self, clock):
+        """Called every simulated tick before dispatch, for policies whose queues change over time."""
+
+    def next_wakeup(self):
+        """Tick on which on_tick will next change the queues, or None if it never will by itself."""
+        return None
+
+    def enqueue_waiting(self, job, clock):
+        """Add a job whose next burst is an I/O burst."""
+        self.waiting_queue.append(job)
+
+    def select_waiting(self, io_index, clock):
+        """Remove and return the job the free I/O device `io_index` should serve, or None."""
+        return self.waiting_queue.popleft() if self.waiting_queue else None
+
+    def has_ready(self):
+        return bool(self.ready_queue)
+
+    def has_waiting(self):
+        return bool(self.waiting_queue)
+
+    def ready_jobs(self):
+        """Jobs in the READY queue in dispatch order, for visualization."""
+        return list(self.ready_queue)
+
+    def waiting_jobs(self):
+        """Jobs in the WAITING queue in dispatch order, for visualization."""
+        return list(self.waiting_queue)
+
+    def stats(self):
+        """Policy-specific counters merged into the run summary."""
+        return {}
+
+
+class SchedulerEngine:
+    """
+    Simulation loop shared by every scheduler.
+
+    Each tick admits new jobs, dispatches free CPUs and I/O devices, advances the
+    busy ones, moves jobs whose burst ended to their next burst and redraws the
+    tables. Ticks in which nothing can change are skipped through the event
+    queue. All scheduling decisions are delegated to the policy object.
+    """
+
+    visualizer_class = RichTable
+
+    # Attributes tied to the running process, left out of checkpoints and rebuilt by attach()
+    transient = ("api", "logger", "visualizer", "timeline", "profiler", "can_skip", *PHASES)
+
+    def __init__(self, config, api, logger, policy):
+        self.config = config
+        if config.get("per_cpu_queues"):
+            from scheduler.percpu import PerCPUPolicy  # Imported here: percpu builds on Policy
+
+            policy = PerCPUPolicy(config, policy)  # One run queue per CPU with work stealing
+        self.policy = policy
+        self.running_queue = [None] * config["cpus"]  # Tracks jobs currently running on CPUs
+        self.io_devices = [None] * config["ios"]  # Tracks jobs currently running on I/O devices
+        self.terminated_count = 0  # Jobs that have completed all bursts
+        self.terminated_ids = []  # Their ids, kept only for the live table (never in headless runs)
+        self.total_jobs = None  # Job count of the session, cached from api.jobs_left
+        self.metrics = Metrics(config["cpus"], config["ios"])  # Per-job times and per-device busy time
+        self.events = EventQueue()  # Pending burst completions and quantum expiries, kept only when idle ticks can be skipped
+        self.attach(api, logger)
+
+    def attach(self, api, logger):
+        """
+        Connect the engine to its API backend and logger and create its table,
+        timeline and profiler. Also used to bring an engine restored from a
+        checkpoint back to life.
+        """
+        self.api = api
+        self.logger = logger
+        # Idle ticks can only be skipped when the backend announces arrivals (remote ones cannot)
+        self.can_skip = getattr(api, "next_arrival", None) is not None
+        self.visualizer = self._create_visualizer()  # Initialize the table for visualization
+        self.timeline = self._create_timeline()
+        self.profiler = PhaseProfiler() if self.config.get("profile") else NullProfiler()
+        self.profiler.attach(self)  # Times each tick-loop phase and its API calls when profiling
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self.transient:
+            state.pop(name, None)
+        return state
+
+    def _create_timeline(self):
+        """Stream job state transitions to config["timeline"] (.csv or binary) when it is set."""
+        path = self.config.get("timeline")
+        if not path:
+            return NullTimeline()
+        return TimelineWriter(path)
+
+    def _create_visualizer(self):
+        """No table in headless mode, otherwise a live table redrawn every tick or at config["fps"]."""
+        if self.config.get("headless"):
+            return NullTable()
+        return self.visualizer_class(fps=self.config.get("fps"))
+
+    @property
+    def ready_queue(self):
+        return self.policy.ready_queue
+
+    @property
+    def waiting_queue(self):
+        return self.policy.waiting_queue
+
+    def _route(self, job, clock):
+        """Queue a job for the device type its current burst needs."""
+        job.queued_at = clock
+        if job.burst_type == "IO":
+            self.policy.enqueue_waiting(job, clock)
+            self.timeline.record(clock, "waiting", job.job_id)
+            self.logger.debug(f"Job {job.job_id} added to WAITING queue with burst time {job.burst_time}")
+        else:
+            self.policy.enqueue(job, clock)
+            self.timeline.record(clock, "ready", job.job_id)
+            self.logger.debug(f"Job {job.job_id} added to READY queue with burst time {job.burst_time}")
+
+    def _admit_jobs(self, session_id, clock):
+        """Fetch the jobs arriving at `clock` and queue them for their first burst."""
+        new_jobs = self.api.get_jobs(session_id, clock)
+        if not new_jobs:
+            return
+        new_jobs = [Job.from_api(data) for data in new_jobs]
+        # Fetch the first burst of every arriving job in one batch
+        bursts = self.api.get_bursts(session_id, [job.job_id for job in new_jobs])
+        for job, burst in zip(new_jobs, bursts):
+            if burst:
+                job.burst_time = job.burst_length = burst["duration"]
+                job.burst_type = burst["burst_type"]
+                job.metrics_row = self.metrics.add_job(job.job_id, clock)
+                self.timeline.record(clock, "arrive", job.job_id)
+                self._route(job, clock)
+
+    def _dispatch_cpus(self, clock):
+        """Give every free CPU the next job its policy selects, then apply preemptions."""
+        policy = self.policy
+        if policy.has_ready():
+            for cpu_index, running in enumerate(self.running_queue):
+                if running is None:
+                    job = policy.select_next(cpu_index, clock)
+                    if job is not None:
+                        self._run_on_cpu(cpu_index, job, clock)
+            if policy.has_ready():
+                self._preempt(clock)
+
+    def _dispatch_io(self, clock):
+        """Give every free I/O device the next WAITING job its policy selects."""
+        policy = self.policy
+        if policy.has_waiting():
+            for io_index, serving in enumerate(self.io_devices):
+                if serving is None:
+                    job = policy.select_waiting(io_index, clock)
+                    if job is None:
+                        continue
+                    job.remaining_time = job.burst_time
+                    job.quantum_remaining = None
+                    job.start = clock
+                    self.io_devices[io_index] = job
+                    self.metrics.record_io_wait(job.metrics_row, clock - job.queued_at)
+                    if self.can_skip:
+                        self.events.schedule(clock + job.burst_time - 1, self.io_devices, io_index)
+                    self.timeline.record(clock, "io", job.job_id, "io", io_index)
+                    self.logger.debug(f"Job {job.job_id} assigned to I/O Device {io_index}")
+
+    def _run_on_cpu(self, cpu_index, job, clock):
+        """Place `job` on CPU `cpu_index` and schedule the event that ends its turn."""
+        quantum = self.policy.quantum(job)
+        job.remaining_time = job.burst_time
+        job.quantum_remaining = quantum
+        job.start = clock
+        self.running_queue[cpu_index] = job
+        self.metrics.record_dispatch(job.metrics_row, clock)
+        if self.can_skip:  # Events are only read, and their stale entries only dropped, by the idle skip
+            ends = job.burst_time if quantum is None else min(job.burst_time, quantum)
+            self.events.schedule(clock + ends - 1, self.running_queue, cpu_index)
+        self.timeline.record(clock, "run", job.job_id, "cpu", cpu_index)
+        self.logger.debug(f"Job {job.job_id} assigned to CPU {cpu_index}")
+
+    def _preempt(self, clock):
+        """
+        With every CPU busy and jobs still READY, swap out the running jobs the
+        policy picks as victims (preemptive policies such as SRTF) before they run
+        this tick.
+        """
+        policy = self.policy
+        while policy.has_ready():
+            cpu_index = policy.select_victim(self.running_queue, clock)
+            if cpu_index is None:
+                return
+            job = self.running_queue[cpu_index]
+            self.metrics.record_cpu(job.metrics_row, cpu_index, clock - job.start)
+            job.burst_time = job.remaining_time
+            job.queued_at = clock
+            self.running_queue[cpu_index] = None
+            self.timeline.record(clock, "preempt", job.job_id, "cpu", cpu_index)
+            self.logger.debug(f"Job {job.job_id} preempted on CPU {cpu_index}")
+            policy.on_preempt(job, clock)
+            self._run_on_cpu(cpu_index, policy.select_next(cpu_index, clock), clock)
+
+    def _process_cpus(self, session_id, clock):
+        """Advance every busy CPU by one tick and release jobs whose burst or quantum ended."""
+        verbose = self.logger.verbose
+        leaving_jobs = []  # Jobs leaving a CPU this tick (completed or preempted), in CPU order
+        for cpu_index, job in enumerate(self.running_queue):
+            if job is None:
+                continue
+            job.remaining_time -= 1
+            if verbose:
+                self.logger.debug(f"CPU {cpu_index} processing Job {job.job_id} - Remaining Burst Time: {job.remaining_time}")
+
+            if job.remaining_time == 0:
+                self.logger.debug(f"Job {job.job_id} completed CPU burst at clock {clock}")
+                job.burst_time = 0
+                self.policy.on_cpu_burst_complete(job, clock)
+                self.timeline.record(clock, "cpu_done", job.job_id, "cpu", cpu_index)
+            elif job.quantum_remaining is not None:
+                job.quantum_remaining -= 1
+                if job.quantum_remaining > 0:
+                    continue
+                self.logger.debug(f"Job {job.job_id} preempted on CPU {cpu_index} after time slice")
+                job.burst_time = job.remaining_time
+                self.timeline.record(clock, "quantum", job.job_id, "cpu", cpu_index)
+            else:
+                continue
+
+            # The job leaves the CPU: credit the ticks it ran since dispatch
+            self.metrics.record_cpu(job.metrics_row, cpu_index, clock - job.start + 1)
+            leaving_jobs.append(job)
+            self.running_queue[cpu_index] = None
+        self._advance_bursts(session_id, clock, leaving_jobs)
+
+    def _process_io(self, session_id, clock):
+        """Advance every busy I/O device by one tick and release jobs whose burst ended."""
+        verbose = self.logger.verbose
+        finished_jobs = []
+        for io_index, job in enumerate(self.io_devices):
+            if job is None:
+                continue
+            job.remaining_time -= 1
+            if verbose:
+                self.logger.debug(f"I/O Device {io_index} processing Job {job.job_id} - Remaining Burst Time: {job.remaining_time}")
+
+            if job.remaining_time == 0:
+                self.logger.debug(f"Job {job.job_id} completed I/O burst at clock {clock}")
+                job.burst_time = 0
+                self.metrics.record_io(job.metrics_row, io_index, clock - job.start + 1)
+                self.timeline.record(clock, "io_done", job.job_id, "io", io_index)
+                finished_jobs.append(job)
+                self.io_devices[io_index] = None
+        self._advance_bursts(session_id, clock, finished_jobs)
+
+    def _advance_bursts(self, session_id, clock, jobs):
+        """
+        Requeue jobs leaving a device: preempted jobs go back to their policy,
+        jobs that finished a burst are moved to their next burst with one
+        batched API call. Jobs are handled in order to keep the queue order.
+        """
+        if not jobs:
+            return
+        finished = [job.job_id for job in jobs if job.burst_time == 0]
+        next_bursts = iter(self.api.next_bursts(session_id, finished) if finished else [])
+        for job in jobs:
+            if job.burst_time > 0:
+                job.queued_at = clock
+                self.policy.on_quantum_expire(job, clock)
+                continue
+
+            next_burst = next(next_bursts)
+            if next_burst:
+                job.burst_time = job.burst_length = next_burst["duration"]
+                job.burst_type = next_burst["burst_type"]
+                self._route(job, clock)
+            else:
+                self._terminate(job, clock)
+
+    def _terminate(self, job, clock):
+        self.terminated_count += 1
+        if not self.config.get("headless"):
+            self.terminated_ids.append(job.job_id)
+        self.timeline.record(clock, "terminate", job.job_id)
+        self.logger.debug(f"Job {job.job_id} has completed all bursts and is now TERMINATED")
+        self.metrics.record_completion(job.metrics_row, clock)
+
+    def _is_finished(self, session_id):
+        """
+        Exit condition: all queues and devices are empty and every job has terminated.
+        The session's job count is fetched from the API the first time the
+        system drains and cached; the API is asked again only once as many jobs
+        have terminated, to confirm the end of the run.
+        """
+        if (
+            any(self.running_queue)
+            or any(self.io_devices)
+            or self.policy.has_ready()
+            or self.policy.has_waiting()
+        ):
+            return False
+        terminated = self.terminated_count
+        if self.total_jobs is not None and terminated < self.total_jobs:
+            return False  # Idle between arrivals: more jobs are known to come
+        self.total_jobs = self.api.jobs_left(session_id)
+        return self.total_jobs == terminated
+
+    def _skip_idle_ticks(self, session_id, clock):
+        """
+        Fast-forward over the ticks after `clock` in which nothing can change:
+        no job arrives, no burst or quantum ends, the policy has no wakeup due
+        and no dispatch or preemption is pending.
+        Busy devices are advanced in one step so the metrics match a tick-by-tick
+        run. Returns the number of ticks skipped.
+        Without arrival announcements (can_skip is False) no tick is known to
+        be idle, not even before a policy wakeup such as an MLFQ promotion.
+        """
+        if not self.can_skip:
+            return 0
+        policy = self.policy
+        if policy.has_ready() and (
+            not all(self.running_queue) or policy.select_victim(self.running_queue, clock) is not None
+        ):
+            return 0  # A CPU would be dispatched or preempted next tick
+        if policy.has_waiting() and not all(self.io_devices):
+            return 0
+        next_event = self.events.next_event(self.api, session_id, clock)
+        wakeup = policy.next_wakeup()
+        if wakeup is not None and (next_event is None or wakeup < next_event):
+            next_event = wakeup
+        if next_event is None or next_event <= clock + 1:
+            return 0
+
+        skipped = next_event - clock - 1
+        for job in self.running_queue:
+            if job:
+                job.remaining_time -= skipped
+                if job.quantum_remaining is not None:
+                    job.quantum_remaining -= skipped
+        for job in self.io_devices:
+            if job:
+                job.remaining_time -= skipped
+        self.metrics.total_time += skipped
+        return skipped
+
+    def render(self, force=False):
+        """Update the live visualization when the visualizer wants a frame (or always with `force`)."""
+        if not (force or self.visualizer.frame_due()):
+            return
+        self.visualizer.show_tables(
+            self.policy.ready_jobs(),
+            self.policy.waiting_jobs(),
+            self.running_queue,
+            self.io_devices,
+            self.terminated_ids,
+        )
+
+    def run_simulation(self, session_id, start_clock, time_slice=None):
+        self.policy.start(time_slice)
+        self.metrics.total_time = 0  # Track total simulation time
+        return self.resume_simulation(session_id, start_clock)
+
+    def resume_simulation(self, session_id, clock):
+        """
+        Run the tick loop from `clock` until every job has terminated. Called
+        by run_simulation, or directly to continue an engine restored from a
+        checkpoint.
+
+        With config["checkpoint"] set, the state is saved there every
+        config["checkpoint_every"] ticks (if set) and on SIGINT, which then
+        ends the run by raising KeyboardInterrupt.
+        """
+        checkpoint_path = self.config.get("checkpoint")
+        checkpoint_every = self.config.get("checkpoint_every")
+        next_checkpoint = clock + checkpoint_every if checkpoint_path and checkpoint_every else float("inf")
+
+        # Close the table and timeline however the loop ends, so an interrupted
+        # run (with or without a checkpoint) still flushes its buffered timeline rows
+        try:
+            with InterruptFlag(enabled=bool(checkpoint_path)) as interrupt:
+                while True:
+                    self.metrics.total_time += 1  # Increment total time for metrics calculation
+                    if self.logger.verbose:
+                        self.logger.debug(f"Clock: {clock}")
+
+                    self._admit_jobs(session_id, clock)
+                    self.policy.on_tick(clock)
+                    self._dispatch_cpus(clock)
+                    self._dispatch_io(clock)
+                    self._process_cpus(session_id, clock)
+                    self._process_io(session_id, clock)
+                    self.render()
+
+                    if self._is_finished(session_id):
+                        self.logger.info("All jobs completed!")
+                        break
+
+                    clock += 1 + self._skip_idle_ticks(session_id, clock)
+
+                    # Checkpoint between ticks, where the state is consistent
+                    if clock >= next_checkpoint or interrupt.requested:
+                        save_checkpoint(checkpoint_path, self, session_id, clock)
+                        next_checkpoint = clock + checkpoint_every if checkpoint_every else float("inf")
+                        if interrupt.requested:
+                            self.logger.info(f"Interrupted at clock {clock}; saved checkpoint to {checkpoint_path}")
+                            raise KeyboardInterrupt
+
+            self.render(force=True)  # Show the final state even if throttling skipped the last ticks
+        finally:
+            self.visualizer.close()
+            self.timeline.close()
+
+        self.report()
+        self.profiler.report()
+        return self.summary()
+
+    def summary(self):
+        """
+        Aggregate metrics of the run.
+        Returns:
+            dict: Metrics.summary() (averages, percentiles, throughput, utilization),
+            the policy's stats() and the number of simulated ticks.
+        """
+        return {**self.metrics.summary(), **self.policy.stats(), "ticks": self.metrics.total_time}
+
+    def report(self):
+        """Calculate and log the run's metrics."""
+        summary = self.summary()
+        self.logger.info(f"Average Turnaround Time: {summary['avg_turnaround']}")
+        self.logger.info(f"Average Waiting Time: {summary['avg_waiting']}")
+        self.logger.info(f"Average Response Time: {summary['avg_response']}")
+        self.logger.info(f"Average I/O Wait Time: {summary['avg_io_wait']}")
+        for name, label in (("turnaround", "Turnaround"), ("waiting", "Waiting"), ("response", "Response"), ("io_wait", "I/O Wait")):
+            self.logger.info(
+                f"{label} Time p50/p95/p99: "
+                f"{summary[f'p50_{name}']:.1f} / {summary[f'p95_{name}']:.1f} / {summary[f'p99_{name}']:.1f}"
+            )
+        self.logger.info(f"Throughput: {summary['throughput']:.4f} jobs/tick")
+        self.logger.info(f"Context Switches: {summary['context_switches']}")
+        self.logger.info(f"CPU Utilization: {summary['cpu_utilization']:.2f}%")
+        self.logger.info(f"I/O Utilization: {summary['io_utilization']:.2f}%")
+        devices = [f"CPU {i}: {value:.2f}%" for i, value in enumerate(summary["cpu_device_utilization"])]
+        devices += [f"I/O {i}: {value:.2f}%" for i, value in enumerate(summary["io_device_utilization"])]
+        self.logger.info(f"Per-device Utilization: {', '.join(devices)}")
+        self.logger.info(f"CPU Load Imbalance: {summary['cpu_load_imbalance']:.2f}%")
+        for name, value in self.policy.stats().items():
+            self.logger.info(f"{name.replace('_', ' ').title()}: {value}")
+
+        # Log turnaround time and waiting time for each job
+        self.logger.info("Job Turnaround and Waiting Times:")
+        job_ids, turnaround, waiting, _, _ = self.metrics.job_times()
+        for job_id, turnaround_time, waiting_time in zip(job_ids, turnaround.tolist(), waiting.tolist()):
+            self.logger.info(f"Job {job_id} - Turnaround Time: {turnaround_time}, Waiting Time: {waiting_time}")
@@ -0,0 +1,59 @@
+import heapq
+import itertools
+
+
+class EventQueue:
+    """
+    Priority queue of pending burst-completion and quantum-expiry events, keyed
+    by the clock tick they fire on.
+
+    An event is scheduled when a job is placed on a CPU or I/O device slot and
+    stays valid only while that slot still holds the same assignment (the same
+    job, dispatched on the same tick), so stale events are dropped lazily
+    instead of being searched for and removed.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.counter = itertools.count()  # Tie-breaker so jobs are never compared
+
+    def __getstate__(self):
+        # Save the tie-breaker as the next number to hand out (itertools.count is not picklable everywhere)
+        state = self.__dict__.copy()
+        state["counter"] = next(self.counter)
+        self.counter = itertools.count(state["counter"])
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.counter = itertools.count(state["counter"])
+
+    def schedule(self, time, devices, index):
+        """Register that the assignment now in devices[index] ends on tick `time`."""
+        job = devices[index]
+        heapq.heappush(self.heap, (time, next(self.counter), devices, index, job, job.start))
+
+    def next_time(self):
+        """Return the tick of the earliest valid event, or None if no device is busy."""
+        heap = self.heap
+        while heap:
+            time, _, devices, index, job, start = heap[0]
+            if devices[index] is job and job.start == start:
+                return time
+            heapq.heappop(heap)
+        return None
+
+    def next_event(self, api, session_id, clock):
+        """
+        Return the first tick after `clock` on which the simulation state can
+        change (an event or a job arrival), or None if it is not known. Remote
+        backends cannot announce arrivals, so they never allow a skip.
+        """
+        next_arrival = getattr(api, "next_arrival", None)
+        if next_arrival is None:
+            return None
+        arrival = next_arrival(session_id, clock)
+        event = self.next_time()
+        if arrival is None or event is None:
+            return event if arrival is None else arrival
+        return min(arrival, event)
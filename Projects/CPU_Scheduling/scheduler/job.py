@@ -0,0 +1,51 @@
+class Job:
+    """
+    A job moving through the scheduler.
+
+    Jobs arrive from the API as dicts and are converted once on admission. The
+    record uses __slots__, so it has no per-instance __dict__ and its fields are
+    plain attribute reads. A job placed on a CPU or I/O device also holds that
+    assignment's state (remaining time, quantum, dispatch tick), so the device
+    slots hold the job itself instead of a separate dict per dispatch.
+    """
+
+    __slots__ = (
+        "job_id",
+        "arrival_time",
+        "priority",
+        "burst_time",  # Remaining duration of the current burst while queued, 0 once it completes
+        "burst_type",  # "CPU" or "IO"
+        "burst_length",  # Full duration of the current burst
+        "predicted_burst",  # Predicted CPU burst length, for policies that estimate it
+        "metrics_row",  # Row of the job in Metrics
+        "remaining_time",  # Ticks left on the device the job occupies
+        "quantum_remaining",  # Ticks left in the CPU time slice, None without preemption
+        "start",  # Tick the job was placed on its current device
+        "queued_at",  # Tick the job entered its current queue
+        "affinity",  # CPU the job is pinned to, or None to run anywhere
+        "last_cpu",  # CPU the job last ran on, with per-CPU run queues
+    )
+
+    def __init__(self, job_id, arrival_time=0, priority=None, affinity=None):
+        self.job_id = job_id
+        self.arrival_time = arrival_time
+        self.priority = priority
+        self.burst_time = 0
+        self.burst_type = None
+        self.burst_length = 0
+        self.predicted_burst = None
+        self.metrics_row = None
+        self.remaining_time = 0
+        self.quantum_remaining = None
+        self.start = None
+        self.queued_at = None
+        self.affinity = affinity
+        self.last_cpu = None
+
+    @classmethod
+    def from_api(cls, data):
+        """Build a job from a job dict returned by the API's get_jobs."""
+        return cls(data["job_id"], data.get("arrival_time", 0), data.get("priority"), data.get("affinity"))
+
+    def __repr__(self):
+        return f"Job({self.job_id}, {self.burst_type} {self.burst_time})"
@@ -0,0 +1,163 @@
+from scheduler.engine import Policy
+
+
+class PerCPUPolicy(Policy):
+    """
+    Multi-core mode: every CPU gets its own run queue, each one an instance of
+    the scheduler's policy, so dispatch only touches the CPU's own queue instead
+    of one global READY queue.
+
+    - A job with an `affinity` is always queued on (and only run by) that CPU.
+    - Other jobs go back to the CPU they last ran on; new jobs go to the
+      shortest queue.
+    - A CPU whose queue is empty steals the next job of the longest queue whose
+      next job is not pinned elsewhere, not counting the job an idle owner is
+      about to take itself.
+
+    The WAITING queue stays shared: I/O devices are not per CPU. Counts of
+    migrations (a job running on a different CPU than last time) and steals are
+    reported through stats().
+    """
+
+    def __init__(self, config, policy):
+        self.config = config
+        self.shared = policy  # Serves the WAITING queue and keeps the scheduler's settings
+        self.local = [type(policy)(config) for _ in range(config["cpus"])]
+        self.loads = [0] * len(self.local)  # READY jobs per CPU queue
+        self.busy = [False] * len(self.local)  # CPUs running a job handed out by select_next
+        self.ready_count = 0
+        policy_class = type(policy)
+        self.preemptive = policy_class.select_victim is not Policy.select_victim
+        self.ticking = policy_class.on_tick is not Policy.on_tick
+        self.migrations = 0
+        self.steals = 0
+
+    @property
+    def ready_queue(self):
+        return self.ready_jobs()
+
+    @property
+    def waiting_queue(self):
+        return self.shared.waiting_queue
+
+    def start(self, time_slice):
+        self.shared.start(time_slice)
+        for policy in self.local:
+            policy.start(time_slice)
+
+    def _home(self, job):
+        """CPU queue a job joins when it becomes READY."""
+        if job.affinity is not None:
+            job.affinity %= len(self.local)  # Pins from a machine with more CPUs wrap around
+            return job.affinity
+        if job.last_cpu is not None:
+            return job.last_cpu
+        return min(range(len(self.loads)), key=self.loads.__getitem__)
+
+    def _added(self, cpu_index):
+        self.loads[cpu_index] += 1
+        self.ready_count += 1
+
+    def enqueue(self, job, clock):
+        cpu_index = self._home(job)
+        self.local[cpu_index].enqueue(job, clock)
+        self._added(cpu_index)
+
+    def on_quantum_expire(self, job, clock):
+        self.busy[job.last_cpu] = False
+        self.local[job.last_cpu].on_quantum_expire(job, clock)
+        self._added(job.last_cpu)
+
+    def on_preempt(self, job, clock):
+        self.busy[job.last_cpu] = False
+        self.local[job.last_cpu].on_preempt(job, clock)
+        self._added(job.last_cpu)
+
+    def _steal_from(self, cpu_index):
+        """Longest queue whose next job CPU `cpu_index` may run, or None."""
+        victim, longest = None, 0
+        for other, load in enumerate(self.loads):
+            stealable = load if self.busy[other] else load - 1  # An idle owner serves its own queue first
+            if stealable > longest:
+                affinity = self.local[other].peek_next().affinity
+                if affinity is None or affinity == cpu_index:
+                    victim, longest = other, stealable
+        return victim
+
+    def select_next(self, cpu_index, clock):
+        if not self.ready_count:
+            return None
+        source = cpu_index
+        if not self.loads[cpu_index]:
+            source = self._steal_from(cpu_index)
+            if source is None:
+                return None
+            self.steals += 1
+        job = self.local[source].select_next(cpu_index, clock)
+        self.loads[source] -= 1
+        self.ready_count -= 1
+        if job.last_cpu is not None and job.last_cpu != cpu_index:
+            self.migrations += 1
+        job.last_cpu = cpu_index
+        self.busy[cpu_index] = True
+        return job
+
+    def peek_next(self):
+        for policy in self.local:
+            job = policy.peek_next()
+            if job is not None:
+                return job
+        return None
+
+    def quantum(self, job):
+        return self.local[job.last_cpu].quantum(job)
+
+    def select_victim(self, running_jobs, clock):
+        """Let each CPU's policy decide whether its running job yields to its own queue."""
+        if not self.preemptive:
+            return None
+        for cpu_index, policy in enumerate(self.local):
+            job = running_jobs[cpu_index]
+            if self.loads[cpu_index] and job is not None and policy.select_victim([job], clock) is not None:
+                return cpu_index
+        return None
+
+    def on_cpu_burst_complete(self, job, clock):
+        self.busy[job.last_cpu] = False
+        self.local[job.last_cpu].on_cpu_burst_complete(job, clock)
+
+    def on_tick(self, clock):
+        if self.ticking:
+            for policy in self.local:
+                policy.on_tick(clock)
+
+    def next_wakeup(self):
+        if not self.ticking:
+            return None
+        wakeups = [wakeup for wakeup in (policy.next_wakeup() for policy in self.local) if wakeup is not None]
+        return min(wakeups) if wakeups else None
+
+    def enqueue_waiting(self, job, clock):
+        self.shared.enqueue_waiting(job, clock)
+
+    def select_waiting(self, io_index, clock):
+        return self.shared.select_waiting(io_index, clock)
+
+    def has_ready(self):
+        return self.ready_count > 0
+
+    def has_waiting(self):
+        return self.shared.has_waiting()
+
+    def ready_jobs(self):
+        return [job for policy in self.local for job in policy.ready_jobs()]
+
+    def waiting_jobs(self):
+        return self.shared.waiting_jobs()
+
+    def stats(self):
+        stats = {"migrations": self.migrations, "steals": self.steals}
+        for policy in self.local:
+            for name, value in policy.stats().items():
+                stats[name] = stats.get(name, 0) + value  # The policy's own counters, summed over the CPUs
+        return stats
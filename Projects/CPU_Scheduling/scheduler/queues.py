@@ -0,0 +1,44 @@
+import heapq
+import itertools
+
+
+class PriorityJobQueue:
+    """
+    Binary-heap job queue with O(log n) push and pop.
+
+    Jobs are served by ascending key; jobs with equal keys come out in the order
+    they were pushed, so ties behave like a FIFO queue.
+    """
+
+    def __init__(self):
+        self.heap = []  # (key, sequence, job) entries
+        self.sequence = itertools.count()
+
+    def __getstate__(self):
+        # Pickle the sequence as the next number push() would use
+        state = self.__dict__.copy()
+        state["sequence"] = next(self.sequence)
+        self.sequence = itertools.count(state["sequence"])
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.sequence = itertools.count(state["sequence"])
+
+    def push(self, key, job):
+        heapq.heappush(self.heap, (key, next(self.sequence), job))
+
+    def pop(self):
+        """Remove and return the job with the lowest key."""
+        return heapq.heappop(self.heap)[2]
+
+    def peek(self):
+        """Return the job with the lowest key without removing it."""
+        return self.heap[0][2]
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __iter__(self):
+        """Iterate over the jobs in serving order. O(n log n); meant for display only."""
+        return (job for _, _, job in sorted(self.heap))
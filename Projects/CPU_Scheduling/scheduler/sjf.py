@@ -0,0 +1,69 @@
+from scheduler.engine import Policy, SchedulerEngine
+from scheduler.queues import PriorityJobQueue
+
+
+class SJFPolicy(Policy):
+    """
+    Shortest-Job-First: the READY queue is a heap keyed by each job's predicted
+    CPU burst, FIFO among equal predictions, and jobs run their burst to completion.
+
+    The scheduler does not know a burst's length before it runs, so it is
+    predicted by exponential averaging of the job's past CPU bursts:
+        prediction = alpha * last_burst + (1 - alpha) * previous_prediction
+    starting from config["sjf_initial_estimate"].
+    """
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.ready_queue = PriorityJobQueue()
+        self.alpha = config.get("sjf_alpha", 0.5)  # Weight of the most recent burst
+        self.initial_estimate = config.get("sjf_initial_estimate", 7)  # Prediction for a job's first burst
+
+    def predicted_remaining(self, job, time_left):
+        """Predicted CPU time left in the job's current burst when `time_left` of it actually remains."""
+        if job.predicted_burst is None:
+            job.predicted_burst = self.initial_estimate
+        return max(job.predicted_burst - (job.burst_length - time_left), 0)
+
+    def enqueue(self, job, clock):
+        self.ready_queue.push(self.predicted_remaining(job, job.burst_time), job)
+
+    def select_next(self, cpu_index, clock):
+        return self.ready_queue.pop() if self.ready_queue else None
+
+    def peek_next(self):
+        return self.ready_queue.peek() if self.ready_queue else None
+
+    def on_cpu_burst_complete(self, job, clock):
+        job.predicted_burst = self.alpha * job.burst_length + (1 - self.alpha) * job.predicted_burst
+
+
+class SRTFPolicy(SJFPolicy):
+    """
+    Shortest-Remaining-Time-First: preemptive SJF. A running job is preempted
+    when a READY job's predicted burst is shorter than the running job's
+    predicted remaining time; the running job with the longest prediction is
+    preempted first.
+    """
+
+    def select_victim(self, running_jobs, clock):
+        head = self.ready_queue.peek()
+        shortest = self.predicted_remaining(head, head.burst_time)
+        victim, longest = None, shortest
+        for cpu_index, job in enumerate(running_jobs):
+            if job is None:
+                continue
+            remaining = self.predicted_remaining(job, job.remaining_time)
+            if remaining > longest:
+                victim, longest = cpu_index, remaining
+        return victim
+
+
+class SJF(SchedulerEngine):
+    def __init__(self, config, api, logger):
+        super().__init__(config, api, logger, SJFPolicy(config))
+
+
+class SRTF(SchedulerEngine):
+    def __init__(self, config, api, logger):
+        super().__init__(config, api, logger, SRTFPolicy(config))
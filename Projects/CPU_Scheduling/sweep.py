@@ -0,0 +1,149 @@
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from main import SCHEDULERS, BACKENDS, parse_arguments, load_config
+from utils.logger import NullLogger
+from scheduler.batched import BatchedSimulator
+
+RESULT_COLUMNS = [
+    "sched", "cpus", "ios", "quantum", "seed",
+    "avg_turnaround", "avg_waiting", "avg_response", "avg_io_wait", "p95_turnaround", "p95_waiting", "p95_response",
+    "throughput", "context_switches", "cpu_utilization", "io_utilization", "jobs", "ticks", "wall_time",
+]
+
+
+def parse_list(value, cast=str):
+    """Parse a comma-separated grid axis such as "1,2,4"."""
+    return [cast(item) for item in str(value).split(",") if item != ""]
+
+
+def build_grid(args):
+    """
+    Expand the command-line axes into the list of runs to perform.
+    The time quantum only affects RoundRobin, so the other schedulers are run
+    once per (cpus, ios, seed) instead of once per quantum.
+    """
+    scheds = parse_list(args.get("sched", ",".join(SCHEDULERS)))
+    cpus = parse_list(args.get("cpus", "1"), int)
+    ios = parse_list(args.get("ios", "1"), int)
+    quanta = parse_list(args.get("quantum", ""), int) or [None]
+    seeds = parse_list(args.get("seeds", "1"), int)
+
+    grid = []
+    for sched in scheds:
+        if sched not in SCHEDULERS:
+            print(f"Error: Unsupported scheduler '{sched}'. Supported schedulers: {', '.join(SCHEDULERS.keys())}")
+            sys.exit(1)
+        sched_quanta = quanta if sched == "RoundRobin" else [None]
+        for cpu_count, io_count, quantum, seed in itertools.product(cpus, ios, sched_quanta, seeds):
+            grid.append({"sched": sched, "cpus": cpu_count, "ios": io_count, "quantum": quantum, "seed": seed})
+    return grid
+
+
+def run_combination(config, backend, run):
+    """
+    Run one headless simulation in a worker process.
+    Returns:
+        dict: The run's parameters and its aggregate metrics.
+    """
+    run_config = dict(config, cpus=run["cpus"], ios=run["ios"], seed=run["seed"], headless=True)
+    random.seed(run["seed"])
+
+    api = BACKENDS[backend](run_config)
+    try:
+        session_data = api.init_session(seed=run["seed"])
+        scheduler = SCHEDULERS[run["sched"]](config=run_config, api=api, logger=NullLogger())
+
+        start = time.perf_counter()
+        summary = scheduler.run_simulation(
+            session_data["session_id"],
+            session_data["start_clock"],
+            run["quantum"] if run["quantum"] is not None else session_data["time_slice"],
+        )
+    finally:
+        if hasattr(api, "close"):
+            api.close()  # Remote backends hold pooled connections (and async an event-loop thread)
+    return {**run, **summary, "wall_time": time.perf_counter() - start}
+
+
+def run_batch(config, group):
+    """
+    Run every seed of one (sched, cpus, ios, quantum) group at once with the
+    vectorized BatchedSimulator.
+    Returns:
+        list: One result row per run, like run_combination; wall_time is the
+        batch's time divided evenly over its runs.
+    """
+    first = group[0]
+    run_config = dict(config, cpus=first["cpus"], ios=first["ios"], headless=True)
+    start = time.perf_counter()
+    summaries = BatchedSimulator(run_config, [run["seed"] for run in group], first["sched"], first["quantum"]).run()
+    wall_time = (time.perf_counter() - start) / len(group)
+    return [{**run, **summary, "wall_time": wall_time} for run, summary in zip(group, summaries)]
+
+
+def write_results(rows, path):
+    """Write the result table as CSV, or as Parquet when the path ends in .parquet."""
+    if path.endswith(".parquet"):
+        try:
+            import pandas as pd
+        except ImportError:
+            print("Error: Writing Parquet requires pandas and pyarrow; use a .csv output instead.")
+            sys.exit(1)
+        pd.DataFrame(rows, columns=RESULT_COLUMNS).to_parquet(path, index=False)
+        return
+
+    with open(path, "w", newline="") as results_file:
+        writer = csv.DictWriter(results_file, fieldnames=RESULT_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    args = parse_arguments(sys.argv)
+    if "config" not in args:
+        print("Error: Missing required argument 'config'")
+        print(
+            "Usage: python3 sweep.py config=config/myConfig.json [sched=FCFS,RoundRobin] [cpus=1,2,4] [ios=1,2] "
+            "[quantum=2,4,8] [seeds=1,2,3] [backend=local] [--batched] [workers=4] [out=sweep_results.csv]"
+        )
+        sys.exit(1)
+
+    config = load_config(args["config"])
+    backend = args.get("backend", "local")
+    if backend not in BACKENDS:
+        print(f"Error: Unsupported backend '{backend}'. Supported backends: {', '.join(BACKENDS.keys())}")
+        sys.exit(1)
+
+    grid = build_grid(args)
+    workers = int(args.get("workers", os.cpu_count() or 1))
+    out = args.get("out", "sweep_results.csv")
+    print(f"Running {len(grid)} simulations on {workers} workers...")
+
+    start = time.perf_counter()
+    # --batched runs the FCFS and RoundRobin seeds of each grid point together in
+    # one vectorized simulation; it draws the local backend's workloads. Grid
+    # points with too few seeds to amortize its per-step cost run one by one
+    groups = {}
+    if args.get("batched") and backend == "local":
+        for run in grid:
+            if run["sched"] in BatchedSimulator.SCHEDULERS:
+                groups.setdefault((run["sched"], run["cpus"], run["ios"], run["quantum"]), []).append(run)
+        groups = {key: group for key, group in groups.items() if len(group) >= BatchedSimulator.MIN_RUNS}
+        batched = {id(run) for group in groups.values() for run in group}
+        grid = [run for run in grid if id(run) not in batched]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        batches = executor.map(run_batch, itertools.repeat(config), groups.values())
+        rows = list(executor.map(run_combination, itertools.repeat(config), itertools.repeat(backend), grid))
+        rows = [row for batch in batches for row in batch] + rows
+    write_results(rows, out)
+    print(f"Wrote {len(rows)} results to {out} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
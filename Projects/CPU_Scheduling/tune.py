@@ -0,0 +1,179 @@
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from main import BACKENDS, parse_arguments, load_config
+from sweep import parse_list, run_combination
+
+# Objectives of the search, all minimized
+OBJECTIVES = ("avg_waiting", "avg_response", "context_switches")
+
+# Schedulers the tuner knows how to search
+TUNABLE = ("RoundRobin", "MLFQScheduler")
+
+
+def sample_candidates(sched, config, count, rng, max_quantum, max_aging):
+    """
+    Draw up to `count` distinct parameter sets for `sched`.
+    RoundRobin searches its time quantum; MLFQScheduler its TimeQuantums list
+    (non-decreasing, as many levels as the config has) and AgingThreshold
+    (0 disables aging).
+    Returns:
+        list: Parameter dicts, e.g. {"quantum": 4} or {"TimeQuantums": [...], "AgingThreshold": 8}.
+    """
+    if sched == "RoundRobin":
+        quanta = list(range(1, max_quantum + 1))
+        rng.shuffle(quanta)
+        return [{"quantum": quantum} for quantum in sorted(quanta[:count])]
+
+    levels = len(config["TimeQuantums"])
+    candidates, seen = [], set()
+    for _ in range(count * 20):  # Bounded retries: small spaces run out of distinct candidates
+        if len(candidates) == count:
+            break
+        quanta = sorted(rng.randint(1, max_quantum) for _ in range(levels))
+        aging = rng.randint(0, max_aging)
+        key = (tuple(quanta), aging)
+        if key not in seen:
+            seen.add(key)
+            candidates.append({"TimeQuantums": quanta, "AgingThreshold": aging})
+    return candidates
+
+
+def dominates(a, b):
+    """True if objective vector `a` is no worse than `b` everywhere and better somewhere."""
+    return all(x <= y for x, y in zip(a, b)) and any(x < y for x, y in zip(a, b))
+
+
+def pareto_fronts(scores):
+    """
+    Non-dominated sorting.
+    Args:
+        scores (list): Objective vectors.
+    Returns:
+        list: Lists of indices into `scores`; the first list is the Pareto front.
+    """
+    remaining = set(range(len(scores)))
+    fronts = []
+    while remaining:
+        front = [i for i in remaining if not any(dominates(scores[j], scores[i]) for j in remaining if j != i)]
+        fronts.append(sorted(front))
+        remaining -= set(front)
+    return fronts
+
+
+def evaluate(executor, config, backend, sched, candidates, seeds, cpus, ios):
+    """
+    Run every candidate on every seed in parallel.
+    Returns:
+        list: Per candidate, the objective values averaged over the seeds.
+    """
+    configs, runs = [], []
+    for candidate in candidates:
+        for seed in seeds:
+            configs.append(dict(config, **{key: value for key, value in candidate.items() if key != "quantum"}))
+            runs.append({"sched": sched, "cpus": cpus, "ios": ios, "quantum": candidate.get("quantum"), "seed": seed})
+    rows = list(executor.map(run_combination, configs, itertools.repeat(backend), runs))
+    scores = []
+    for index in range(len(candidates)):
+        candidate_rows = rows[index * len(seeds):(index + 1) * len(seeds)]
+        scores.append(tuple(sum(row[name] for row in candidate_rows) / len(seeds) for name in OBJECTIVES))
+    return scores
+
+
+def successive_halving(executor, config, backend, sched, candidates, seeds, min_seeds, eta, cpus, ios):
+    """
+    Successive halving: evaluate all candidates on `min_seeds` seeds, keep the
+    best 1/eta (by Pareto rank, then by the sum of objectives normalized to the
+    rung's best values) and evaluate the survivors on eta times more seeds,
+    until one rung runs on every seed or too few candidates are left.
+    Returns:
+        tuple: (candidates of the last rung, their scores, seeds they ran on).
+    """
+    budget = min_seeds
+    while True:
+        rung_seeds = seeds[:budget]
+        scores = evaluate(executor, config, backend, sched, candidates, rung_seeds, cpus, ios)
+        print(f"  {len(candidates)} candidates x {len(rung_seeds)} seeds")
+        keep = max(len(candidates) // eta, 1)
+        if budget >= len(seeds) or keep < eta:
+            return candidates, scores, rung_seeds
+
+        best = [min(score[i] for score in scores) or 1 for i in range(len(OBJECTIVES))]
+        rank = {index: front_index for front_index, front in enumerate(pareto_fronts(scores)) for index in front}
+        order = sorted(
+            range(len(candidates)),
+            key=lambda index: (rank[index], sum(value / base for value, base in zip(scores[index], best))),
+        )
+        candidates = [candidates[index] for index in order[:keep]]
+        budget = min(budget * eta, len(seeds))
+
+
+def main():
+    args = parse_arguments(sys.argv)
+    if "config" not in args:
+        print("Error: Missing required argument 'config'")
+        print(
+            "Usage: python3 tune.py config=config/myConfig.json [sched=RoundRobin,MLFQScheduler] [cpus=2] [ios=2] "
+            "[candidates=27] [eta=3] [seeds=27] [min_seeds=3] [max_quantum=20] [max_aging=50] [search_seed=1] "
+            "[backend=local] [workers=4] [out=tune_results.json]"
+        )
+        sys.exit(1)
+
+    config = load_config(args["config"])
+    backend = args.get("backend", "local")
+    if backend not in BACKENDS:
+        print(f"Error: Unsupported backend '{backend}'. Supported backends: {', '.join(BACKENDS.keys())}")
+        sys.exit(1)
+    scheds = parse_list(args.get("sched", ",".join(TUNABLE)))
+    for sched in scheds:
+        if sched not in TUNABLE:
+            print(f"Error: Cannot tune scheduler '{sched}'. Tunable schedulers: {', '.join(TUNABLE)}")
+            sys.exit(1)
+
+    cpus = int(args.get("cpus", 1))
+    ios = int(args.get("ios", 1))
+    eta = int(args.get("eta", 3))  # Rung-to-rung reduction factor
+    seeds = list(range(1, int(args.get("seeds", 27)) + 1))  # The fixed workloads every candidate is scored on
+    min_seeds = int(args.get("min_seeds", 3))  # Seeds in the first rung
+    rng = random.Random(int(args.get("search_seed", 1)))
+    workers = int(args.get("workers", os.cpu_count() or 1))
+
+    start = time.perf_counter()
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for sched in scheds:
+            candidates = sample_candidates(
+                sched, config, int(args.get("candidates", 27)), rng,
+                int(args.get("max_quantum", 20)), int(args.get("max_aging", 50)),
+            )
+            print(f"Tuning {sched}:")
+            candidates, scores, rung_seeds = successive_halving(
+                executor, config, backend, sched, candidates, seeds, min_seeds, eta, cpus, ios
+            )
+            front = pareto_fronts(scores)[0]
+            results[sched] = [
+                {"params": candidates[index], **dict(zip(OBJECTIVES, scores[index])), "seeds": len(rung_seeds)}
+                for index in front
+            ]
+
+            print(f"Pareto front for {sched} (over {len(rung_seeds)} seeds):")
+            print(f"  {'avg_waiting':>12} {'avg_response':>13} {'switches':>10}  params")
+            for entry in sorted(results[sched], key=lambda entry: entry["avg_waiting"]):
+                print(
+                    f"  {entry['avg_waiting']:>12.2f} {entry['avg_response']:>13.2f} "
+                    f"{entry['context_switches']:>10.1f}  {json.dumps(entry['params'])}"
+                )
+    print(f"Tuned {len(scheds)} scheduler(s) in {time.perf_counter() - start:.2f}s")
+
+    if "out" in args:
+        with open(args["out"], "w") as results_file:
+            json.dump(results, results_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,15 @@
 from .api_utils import APIUtils
+from .local_api import LocalAPIUtils
+from .workload import WorkloadGenerator
+from .async_api_utils import AsyncAPIUtils, ConcurrentAPIUtils
+from .trace_cache import RecordingAPIUtils, ReplayAPIUtils
 from .metrics import Metrics
-from .logger import Logger
+from .timeline import TimelineWriter, NullTimeline, read_timeline
+from .profiler import PhaseProfiler, NullProfiler
+from .checkpoint import save_checkpoint, load_checkpoint
+from .logger import Logger, NullLogger
 from .rich_table import RichTable
 from .mlfq_rich_table import MLFQRichTable
 
 
-__all__ = ["fcfs_scheduler", "APIUtils", "Metrics", "Logger", "RichTable", "MLFQRichTable"]
+__all__ = ["fcfs_scheduler", "APIUtils", "LocalAPIUtils", "WorkloadGenerator", "AsyncAPIUtils", "ConcurrentAPIUtils", "RecordingAPIUtils", "ReplayAPIUtils", "Metrics", "TimelineWriter", "NullTimeline", "read_timeline", "PhaseProfiler", "NullProfiler", "save_checkpoint", "load_checkpoint", "Logger", "NullLogger", "RichTable", "MLFQRichTable"]
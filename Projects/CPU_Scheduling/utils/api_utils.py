@@ -1,10 +1,89 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 class APIUtils:
     def __init__(self, config):
         self.base_url = config["base_url"]
         self.client_id = config["client_id"]
         self.config = config
+        self.timeout = config.get("timeout", 5)  # Seconds per request (connect and read)
+        self.stats = {"round_trips": 0, "bytes_sent": 0, "bytes_received": 0}
+        self.stats_lock = threading.Lock()
+        self.session = self._create_session(
+            pool_size=config.get("pool_size", 10),
+            retries=config.get("retries", 3),
+            backoff_factor=config.get("backoff_factor", 0.1),
+        )
+        # With prefetch_bursts, a job's remaining bursts are fetched in the background
+        # when its first burst is, and later transitions are served from memory
+        self.prefetch_bursts = config.get("prefetch_bursts", False)
+        self.prefetched = {}  # (session_id, job_id) -> Future of the deque of the job's remaining bursts
+        self.executor = ThreadPoolExecutor(max_workers=config.get("pool_size", 10)) if self.prefetch_bursts else None
+
+    def _create_session(self, pool_size, retries, backoff_factor):
+        """
+        Creates a keep-alive session whose connections are reused across calls.
+        Args:
+            pool_size (int): Maximum number of pooled connections to the host.
+            retries (int): Retries on connection and gateway errors.
+            backoff_factor (float): Exponential backoff factor between retries.
+        Returns:
+            requests.Session: The pooled session.
+        """
+        # Connection errors are retried on every call: the request never reached the server.
+        # Gateway errors (the server may have served it) only on idempotent calls, never on
+        # POST /init or GET /burst, which pops server-side state. Read timeouts never.
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,  # Hand the final response back so callers keep their status-code handling
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        burst_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry.new(status=0))
+        session = requests.Session()
+        session.headers["Connection"] = "keep-alive"
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.mount(f"{self.base_url}/burst?", burst_adapter)  # Longest prefix wins; /burstsLeft is unaffected
+        return session
+
+    def _request(self, method, url, **kwargs):
+        """
+        Send a request through the pooled session and update the traffic
+        counters (thread-safe: prefetch and async workers share them). Bytes
+        count the request and status lines, headers and bodies.
+        """
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        request = response.request
+        sent = len(f"{request.method} {request.path_url} HTTP/1.1\r\n") + self._headers_size(request.headers)
+        sent += len(request.body or b"")
+        received = len(f"HTTP/1.1 {response.status_code} {response.reason}\r\n") + self._headers_size(response.headers)
+        received += len(response.content)
+        with self.stats_lock:
+            self.stats["round_trips"] += 1
+            self.stats["bytes_sent"] += sent
+            self.stats["bytes_received"] += received
+        return response
+
+    @staticmethod
+    def _headers_size(headers):
+        return sum(len(name) + len(value) + 4 for name, value in headers.items()) + 2  # "name: value\r\n", blank line
+
+    def close(self):
+        """Close the pooled connections."""
+        if self.executor is not None:
+            self.executor.shutdown()
+        self.session.close()
 
     def init_session(self, seed=None):
         """
@@ -17,7 +96,7 @@ class APIUtils:
         url = f"{self.base_url}/init"
         if seed is not None:
             url += f"?seed={seed}"
-        response = requests.post(url, json=self.config)
+        response = self._request("POST", url, json=self.config)
         if response.status_code == 200:
             return response.json()  # Includes time_slice in the response
         else:
@@ -25,28 +104,97 @@ class APIUtils:
 
     def get_jobs(self, session_id, clock_time):
         url = f"{self.base_url}/job?client_id={self.client_id}&session_id={session_id}&clock_time={clock_time}"
-        response = requests.get(url)
+        response = self._request("GET", url)
         if response.status_code == 200:
             return response.json()["data"]
         return []
 
     def get_burst(self, session_id, job_id):
         url = f"{self.base_url}/burst?client_id={self.client_id}&session_id={session_id}&job_id={job_id}"
-        response = requests.get(url)
+        response = self._request("GET", url)
         if response.status_code == 200:
             return response.json()["data"]
         return None
 
     def bursts_left(self, session_id, job_id):
         url = f"{self.base_url}/burstsLeft?client_id={self.client_id}&session_id={session_id}&job_id={job_id}"
-        response = requests.get(url)
+        response = self._request("GET", url)
         if response.status_code == 200:
             return response.json()
         return 0
 
+    def get_bursts(self, session_id, job_ids):
+        """Fetch the next burst of several jobs, in order, and prefetch the rest when enabled."""
+        bursts = [self.get_burst(session_id, job_id) for job_id in job_ids]
+        for job_id, burst in zip(job_ids, bursts):
+            if burst:
+                self.prefetch(session_id, job_id)
+        return bursts
+
+    def prefetch(self, session_id, job_id):
+        """
+        With prefetch_bursts enabled, start fetching every remaining burst of a
+        job in the background. Called once the job's first burst is fetched.
+        """
+        if self.prefetch_bursts and (session_id, job_id) not in self.prefetched:
+            self.prefetched[(session_id, job_id)] = self.executor.submit(self._fetch_remaining, session_id, job_id)
+
+    def _fetch_remaining(self, session_id, job_id):
+        # bursts_left counts the burst the job holds; the requests run in order on one worker
+        count = self.bursts_left(session_id, job_id) - 1
+        return deque(self.get_burst(session_id, job_id) for _ in range(max(count, 0)))
+
+    def export_prefetched(self, session_id):
+        """
+        Return the bursts prefetched for the session's jobs, by job id, once
+        every fetch in flight is done. The server has already handed them out,
+        so a checkpoint keeps them for import_prefetched.
+        """
+        return {
+            job_id: list(future.result())
+            for (prefetched_session, job_id), future in self.prefetched.items()
+            if prefetched_session == session_id
+        }
+
+    def import_prefetched(self, session_id, prefetched):
+        """Serve the bursts saved with export_prefetched from memory again."""
+        for job_id, bursts in prefetched.items():
+            future = Future()
+            future.set_result(deque(bursts))
+            self.prefetched[(session_id, job_id)] = future
+
+    def advance_burst(self, session_id, job_id):
+        """
+        Move a job from its finished burst to the next one.
+        A prefetched job is served from memory; otherwise this asks the server
+        for the remaining count and then for the burst.
+        Returns:
+            tuple: (next burst, or None if the finished burst was the last;
+            number of bursts left after it).
+        """
+        future = self.prefetched.get((session_id, job_id))
+        if future is not None:
+            remaining = future.result()
+            if remaining:
+                return remaining.popleft(), len(remaining)
+            del self.prefetched[(session_id, job_id)]  # The job is done; forget it
+            return None, 0
+        bursts_left = self.bursts_left(session_id, job_id)
+        if bursts_left > 1:
+            return self.get_burst(session_id, job_id), bursts_left - 2
+        return None, 0
+
+    def next_bursts(self, session_id, job_ids):
+        """
+        Advance several jobs to their next burst.
+        Returns:
+            list: The next burst of each job, or None where the finished burst was its last.
+        """
+        return [self.advance_burst(session_id, job_id)[0] for job_id in job_ids]
+
     def jobs_left(self, session_id):
         url = f"{self.base_url}/jobsLeft?client_id={self.client_id}&session_id={session_id}"
-        response = requests.get(url)
+        response = self._request("GET", url)
         if response.status_code == 200:
             return response.json()
         return 0
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .api_utils import APIUtils
+
+
+class AsyncAPIUtils:
+    """
+    Asyncio variant of APIUtils.
+
+    Each call runs on the pooled keep-alive session of an APIUtils instance in a
+    worker thread, so calls awaited together (e.g. with asyncio.gather) are in
+    flight at the same time.
+    """
+
+    def __init__(self, config):
+        self.client_id = config["client_id"]
+        self.config = config
+        self.api = APIUtils(config)
+        self.executor = ThreadPoolExecutor(max_workers=config.get("pool_size", 10))
+
+    @property
+    def stats(self):
+        return self.api.stats
+
+    async def _call(self, method, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, method, *args)
+
+    async def init_session(self, seed=None):
+        return await self._call(self.api.init_session, seed)
+
+    async def get_jobs(self, session_id, clock_time):
+        return await self._call(self.api.get_jobs, session_id, clock_time)
+
+    async def get_burst(self, session_id, job_id):
+        return await self._call(self.api.get_burst, session_id, job_id)
+
+    async def bursts_left(self, session_id, job_id):
+        return await self._call(self.api.bursts_left, session_id, job_id)
+
+    async def jobs_left(self, session_id):
+        return await self._call(self.api.jobs_left, session_id)
+
+    async def get_bursts(self, session_id, job_ids):
+        """Fetch the next burst of several jobs concurrently, and prefetch the rest when enabled."""
+        bursts = await asyncio.gather(*(self.get_burst(session_id, job_id) for job_id in job_ids))
+        for job_id, burst in zip(job_ids, bursts):
+            if burst:
+                self.api.prefetch(session_id, job_id)
+        return bursts
+
+    async def advance_burst(self, session_id, job_id):
+        return await self._call(self.api.advance_burst, session_id, job_id)
+
+    def export_prefetched(self, session_id):
+        return self.api.export_prefetched(session_id)
+
+    def import_prefetched(self, session_id, prefetched):
+        self.api.import_prefetched(session_id, prefetched)
+
+    async def next_burst(self, session_id, job_id):
+        """Return the job's next burst, or None if the finished burst was its last."""
+        burst, _ = await self.advance_burst(session_id, job_id)
+        return burst
+
+    async def next_bursts(self, session_id, job_ids):
+        """Advance several jobs to their next burst concurrently."""
+        return await asyncio.gather(*(self.next_burst(session_id, job_id) for job_id in job_ids))
+
+    def close(self):
+        self.executor.shutdown()
+        self.api.close()
+
+
+class ConcurrentAPIUtils:
+    """
+    Blocking facade over AsyncAPIUtils used as the schedulers' tick driver.
+
+    Runs an event loop on a background thread. The batch calls (get_bursts,
+    next_bursts) that the schedulers make once per tick phase send all of that
+    phase's independent requests at once, so a tick costs about the slowest
+    request instead of the sum of them.
+    """
+
+    def __init__(self, config):
+        self.client_id = config["client_id"]
+        self.config = config
+        self.client = AsyncAPIUtils(config)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def stats(self):
+        return self.client.stats
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def init_session(self, seed=None):
+        return self._run(self.client.init_session(seed))
+
+    def get_jobs(self, session_id, clock_time):
+        return self._run(self.client.get_jobs(session_id, clock_time))
+
+    def get_burst(self, session_id, job_id):
+        return self._run(self.client.get_burst(session_id, job_id))
+
+    def bursts_left(self, session_id, job_id):
+        return self._run(self.client.bursts_left(session_id, job_id))
+
+    def jobs_left(self, session_id):
+        return self._run(self.client.jobs_left(session_id))
+
+    def get_bursts(self, session_id, job_ids):
+        return self._run(self.client.get_bursts(session_id, job_ids))
+
+    def advance_burst(self, session_id, job_id):
+        return self._run(self.client.advance_burst(session_id, job_id))
+
+    def next_bursts(self, session_id, job_ids):
+        return self._run(self.client.next_bursts(session_id, job_ids))
+
+    def export_prefetched(self, session_id):
+        return self.client.export_prefetched(session_id)
+
+    def import_prefetched(self, session_id, prefetched):
+        self.client.import_prefetched(session_id, prefetched)
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.client.close()
@@ -0,0 +1,87 @@
+import gzip
+import os
+import pickle
+import signal
+import threading
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path, engine, session_id, clock):
+    """
+    Snapshot a running simulation to a gzip-compressed pickle.
+
+    The engine is saved without its API backend, logger, table, timeline and
+    profiler (see SchedulerEngine.transient). The API session is saved too
+    when the backend generates it locally; remote sessions live on the server
+    and are only referred to by their id, along with the bursts the client
+    has prefetched from the server and not used yet.
+    Args:
+        path (str): Checkpoint file; written atomically, so an interrupted
+            save never leaves a truncated file behind.
+        engine (SchedulerEngine): The engine, between two ticks.
+        session_id (str): The API session the engine runs.
+        clock (int): The next tick to simulate.
+    """
+    api = engine.api
+    api_state = api.export_session(session_id) if hasattr(api, "export_session") else None
+    prefetched = api.export_prefetched(session_id) if hasattr(api, "export_prefetched") else None
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "engine": engine,
+        "session_id": session_id,
+        "clock": clock,
+        "api_state": api_state,
+        "prefetched": prefetched,
+    }
+    temp_path = f"{path}.tmp"
+    with gzip.open(temp_path, "wb", compresslevel=6) as checkpoint_file:
+        pickle.dump(checkpoint, checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path):
+    """
+    Load a checkpoint written by save_checkpoint. Loading the same file several
+    times gives independent copies, so many runs can be forked from one state.
+    Args:
+        path (str): Checkpoint file.
+    Returns:
+        dict: "engine" (call engine.attach(api, logger) before resuming it),
+        "session_id", "clock", "api_state" (None for remote sessions) and
+        "prefetched" (bursts for APIUtils.import_prefetched, or None).
+    """
+    try:
+        with gzip.open(path, "rb") as checkpoint_file:
+            checkpoint = pickle.load(checkpoint_file)
+    except FileNotFoundError:
+        raise RuntimeError(f"No checkpoint at '{path}'")
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise RuntimeError(f"'{path}' is a checkpoint of an unsupported version")
+    return checkpoint
+
+
+class InterruptFlag:
+    """
+    Context manager that turns SIGINT into a flag the simulation loop checks
+    between ticks, so it can checkpoint a consistent state before stopping.
+    Does nothing when disabled or outside the main thread, where signal
+    handlers cannot be installed.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled and threading.current_thread() is threading.main_thread()
+        self.requested = False
+        self.previous_handler = None
+
+    def _handle(self, signum, frame):
+        self.requested = True
+
+    def __enter__(self):
+        if self.enabled:
+            self.previous_handler = signal.signal(signal.SIGINT, self._handle)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.enabled:
+            signal.signal(signal.SIGINT, self.previous_handler)
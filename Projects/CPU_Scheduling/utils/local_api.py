@@ -0,0 +1,158 @@
+import itertools
+import random
+from collections import deque
+
+from .workload import WorkloadGenerator
+
+
+class LocalAPIUtils:
+    """
+    In-process replacement for APIUtils that generates the workload locally.
+
+    Uses the same config knobs as the remote service (job counts, burst counts,
+    burst intervals, burst_type_ratio, seed) and exposes the same methods, so a
+    scheduler can run against it without any network round-trips.
+
+    Jobs are drawn from a WorkloadGenerator as the clock reaches them and their
+    bursts are dropped once they finish, so memory grows with the number of
+    active jobs, not with the size of the workload. Like the remote session,
+    a session is meant to be read with a clock that never goes backwards.
+    """
+
+    _session_counter = itertools.count(1)
+
+    def __init__(self, config):
+        self.client_id = config["client_id"]
+        self.config = config
+        self.sessions = {}
+
+    def init_session(self, seed=None):
+        """
+        Starts a new lazily generated workload and registers it as a session.
+        Args:
+            seed (int, optional): The seed for reproducibility.
+        Returns:
+            dict: Contains session_id, start_clock, and time_slice.
+        """
+        if seed is None:
+            seed = self.config.get("seed")
+        workload = WorkloadGenerator(self.config, random.Random(seed), start_clock=0)
+        session_id = f"local-{next(self._session_counter)}"
+        self._register(session_id, iter(workload), workload.total_jobs)
+
+        # Own generator derived from the seed, so the time slice is drawn without
+        # generating the workload (the eager generator drew it after the last job)
+        time_slice_rng = random.Random(f"time_slice-{seed}") if seed is not None else random.Random()
+        time_slice = time_slice_rng.randint(self.config["min_ts_interval"], self.config["max_ts_interval"])
+        return {"session_id": session_id, "start_clock": workload.start_clock, "time_slice": time_slice}
+
+    def _register(self, session_id, jobs, total_jobs):
+        """
+        Register a session.
+        Args:
+            jobs (iterator): (arrival_time, job dict, burst deque) tuples in arrival order.
+            total_jobs (int): Number of jobs `jobs` yields.
+        """
+        self.sessions[session_id] = {
+            "jobs": jobs,
+            "upcoming": deque(),  # Jobs drawn from `jobs` that have not arrived yet
+            "bursts": {},  # Remaining bursts of the arrived, unfinished jobs
+            "total_jobs": total_jobs,
+        }
+
+    def export_session(self, session_id):
+        """
+        Returns the session's state (job generator, upcoming arrivals, remaining
+        bursts), picklable so a checkpoint can restore it with import_session.
+        """
+        return self.sessions[session_id]
+
+    def import_session(self, session_id, state):
+        """Restore a session saved with export_session under its session id."""
+        self.sessions[session_id] = state
+
+    def _peek_arrivals(self, session, clock_time):
+        """Draw jobs into the upcoming buffer until one arrives after `clock_time`."""
+        upcoming = session["upcoming"]
+        while not upcoming or upcoming[-1][0] <= clock_time:
+            job = next(session["jobs"], None)
+            if job is None:
+                break
+            upcoming.append(job)
+        return upcoming
+
+    def get_jobs(self, session_id, clock_time):
+        session = self.sessions[session_id]
+        upcoming = self._peek_arrivals(session, clock_time)
+        jobs = []
+        while upcoming and upcoming[0][0] <= clock_time:
+            arrival_time, job, bursts = upcoming.popleft()
+            if arrival_time < clock_time:
+                continue  # The clock moved past this arrival without asking for it
+            session["bursts"][job["job_id"]] = bursts
+            jobs.append(dict(job))  # Schedulers annotate the job dicts they receive
+        return jobs
+
+    def next_arrival(self, session_id, clock_time):
+        """
+        Returns the first clock tick after `clock_time` at which a job arrives,
+        or None if no more jobs arrive. Lets the schedulers skip idle ticks.
+        """
+        for arrival_time, _, _ in self._peek_arrivals(self.sessions[session_id], clock_time):
+            if arrival_time > clock_time:
+                return arrival_time
+        return None
+
+    def get_burst(self, session_id, job_id):
+        job_bursts = self.sessions[session_id]["bursts"].get(job_id)
+        if job_bursts:
+            return job_bursts.popleft()
+        return None
+
+    def bursts_left(self, session_id, job_id):
+        """
+        Returns the number of bursts left for a job, counting the burst it
+        currently holds, so `bursts_left > 1` means another burst can be fetched.
+        """
+        job_bursts = self.sessions[session_id]["bursts"].get(job_id)
+        if job_bursts is None:
+            return 0
+        return len(job_bursts) + 1
+
+    def get_bursts(self, session_id, job_ids):
+        """Fetch the next burst of several jobs, in order."""
+        return [self.get_burst(session_id, job_id) for job_id in job_ids]
+
+    def advance_burst(self, session_id, job_id):
+        """
+        Move a job from its finished burst to the next one.
+        Returns:
+            tuple: (next burst, or None if the finished burst was the last;
+            number of bursts left after it).
+        """
+        bursts = self.sessions[session_id]["bursts"]
+        job_bursts = bursts.get(job_id)
+        if job_bursts:
+            return job_bursts.popleft(), len(job_bursts)
+        bursts.pop(job_id, None)
+        return None, 0
+
+    def next_bursts(self, session_id, job_ids):
+        """
+        Advance several jobs to their next burst.
+        Returns:
+            list: The next burst of each job, or None where the finished burst was its last.
+        """
+        bursts = self.sessions[session_id]["bursts"]
+        next_bursts = []
+        for job_id in job_ids:
+            job_bursts = bursts.get(job_id)
+            if job_bursts:
+                next_bursts.append(job_bursts.popleft())
+            else:
+                bursts.pop(job_id, None)  # The job is done; forget it
+                next_bursts.append(None)
+        return next_bursts
+
+    def jobs_left(self, session_id):
+        return self.sessions[session_id]["total_jobs"]
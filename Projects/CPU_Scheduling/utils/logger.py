@@ -1,3 +1,20 @@
 class Logger:
+    def __init__(self, verbose=True):
+        self.verbose = verbose  # False drops the per-tick messages sent to debug()
+
     def info(self, message):
         print(f"[INFO]: {message}")
+
+    def debug(self, message):
+        if self.verbose:
+            print(f"[DEBUG]: {message}")
+
+
+class NullLogger(Logger):
+    """Logger that drops every message, for batch runs that only need the returned metrics."""
+
+    def __init__(self):
+        super().__init__(verbose=False)
+
+    def info(self, message):
+        pass
@@ -1,21 +1,133 @@
+import numpy as np
+
+
 class Metrics:
-    def __init__(self):
-        self.total_turnaround_time = 0
-        self.total_waiting_time = 0
-        self.jobs_count = 0
-        self.cpu_busy_time = 0
-        self.clock = 0
+    """
+    Per-job metrics store backed by NumPy arrays.
+
+    Every job gets a row holding its arrival, first-run and completion ticks,
+    the CPU and I/O time it received and the time it spent queued for I/O;
+    each CPU and I/O device accumulates its busy ticks. Rows are written a
+    few times per job (never per tick) and all statistics are computed in
+    one vectorized pass at the end of the run.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, cpus=1, ios=0, capacity=1024):
+        self.job_ids = []  # Job id of each row, in arrival order
+        self.arrival = np.zeros(capacity, dtype=np.int64)
+        self.first_run = np.full(capacity, -1, dtype=np.int64)  # -1 until the job is first dispatched
+        self.completion = np.full(capacity, -1, dtype=np.int64)  # -1 until the job terminates
+        self.cpu_time = np.zeros(capacity, dtype=np.int64)
+        self.io_time = np.zeros(capacity, dtype=np.int64)
+        self.io_wait = np.zeros(capacity, dtype=np.int64)  # Ticks spent in the WAITING queue
+        self.cpu_busy = np.zeros(cpus, dtype=np.int64)  # Busy ticks per CPU
+        self.io_busy = np.zeros(ios, dtype=np.int64)  # Busy ticks per I/O device
+        self.total_time = 0  # Simulated ticks
+        self.context_switches = 0  # Jobs placed on a CPU, counting every dispatch
+
+    def _grow(self):
+        """Double the capacity of the per-job arrays."""
+        self.arrival = np.concatenate([self.arrival, np.zeros_like(self.arrival)])
+        self.first_run = np.concatenate([self.first_run, np.full_like(self.first_run, -1)])
+        self.completion = np.concatenate([self.completion, np.full_like(self.completion, -1)])
+        self.cpu_time = np.concatenate([self.cpu_time, np.zeros_like(self.cpu_time)])
+        self.io_time = np.concatenate([self.io_time, np.zeros_like(self.io_time)])
+        self.io_wait = np.concatenate([self.io_wait, np.zeros_like(self.io_wait)])
+
+    def add_job(self, job_id, arrival_time):
+        """
+        Register an arriving job.
+        Returns:
+            int: The job's row, used by the other record_* calls.
+        """
+        row = len(self.job_ids)
+        if row == len(self.arrival):
+            self._grow()
+        self.job_ids.append(job_id)
+        self.arrival[row] = arrival_time
+        return row
+
+    def record_dispatch(self, row, clock):
+        """Note that the job was placed on a CPU at `clock`."""
+        self.context_switches += 1
+        if self.first_run[row] < 0:
+            self.first_run[row] = clock
+
+    def record_cpu(self, row, cpu_index, ticks):
+        """Credit `ticks` of service on CPU `cpu_index` to the job."""
+        self.cpu_time[row] += ticks
+        self.cpu_busy[cpu_index] += ticks
+
+    def record_io(self, row, io_index, ticks):
+        """Credit `ticks` of service on I/O device `io_index` to the job."""
+        self.io_time[row] += ticks
+        self.io_busy[io_index] += ticks
+
+    def record_io_wait(self, row, ticks):
+        """Credit `ticks` spent waiting for an I/O device to the job."""
+        self.io_wait[row] += ticks
+
+    def record_completion(self, row, clock):
+        """Note that the job finished its last burst at the end of tick `clock`."""
+        self.completion[row] = clock + 1
+
+    def job_times(self):
+        """
+        Per-job turnaround, waiting, response and I/O wait times of the completed jobs.
+        Waiting time is the time spent queued, i.e. turnaround minus CPU and I/O service;
+        I/O wait time is the part of it spent queued for an I/O device.
+        Response time is only defined for jobs that ran on a CPU, so jobs made
+        of I/O bursts only are left out of `response`.
+        Returns:
+            tuple: (job_ids, turnaround, waiting, response, io_wait) with NumPy arrays for the times.
+        """
+        count = len(self.job_ids)
+        done = self.completion[:count] >= 0
+        arrival = self.arrival[:count][done]
+        turnaround = self.completion[:count][done] - arrival
+        waiting = turnaround - self.cpu_time[:count][done] - self.io_time[:count][done]
+        first_run = self.first_run[:count][done]
+        dispatched = first_run >= 0
+        response = first_run[dispatched] - arrival[dispatched]
+        io_wait = self.io_wait[:count][done]
+        job_ids = [job_id for job_id, is_done in zip(self.job_ids, done) if is_done]
+        return job_ids, turnaround, waiting, response, io_wait
+
+    def summary(self):
+        """
+        Compute the run's statistics in one vectorized pass.
+        Returns:
+            dict: Means and p50/p95/p99 of turnaround, waiting, response and I/O wait time,
+            throughput, context switches, overall and per-device CPU and I/O
+            utilization and the CPU load imbalance (percent).
+        """
+        _, turnaround, waiting, response, io_wait = self.job_times()
+        jobs = len(turnaround)
+        total_time = self.total_time
 
-    def add_job_stats(self, turnaround_time, waiting_time):
-        self.total_turnaround_time += turnaround_time
-        self.total_waiting_time += waiting_time
-        self.jobs_count += 1
+        summary = {"jobs": jobs}
+        times = (("turnaround", turnaround), ("waiting", waiting), ("response", response), ("io_wait", io_wait))
+        for name, values in times:
+            summary[f"avg_{name}"] = float(values.mean()) if len(values) else 0
+            percentiles = np.percentile(values, self.PERCENTILES) if len(values) else [0] * len(self.PERCENTILES)
+            for percentile, value in zip(self.PERCENTILES, percentiles):
+                summary[f"p{percentile}_{name}"] = float(value)
 
-    def update_cpu_busy(self):
-        self.cpu_busy_time += 1
+        summary["throughput"] = jobs / total_time if total_time > 0 else 0
+        summary["context_switches"] = self.context_switches
+        cpu_utilization = self.cpu_busy / total_time * 100 if total_time > 0 else np.zeros_like(self.cpu_busy)
+        io_utilization = self.io_busy / total_time * 100 if total_time > 0 else np.zeros_like(self.io_busy)
+        summary["cpu_utilization"] = float(cpu_utilization.mean()) if len(cpu_utilization) else 0
+        summary["io_utilization"] = float(io_utilization.mean()) if len(io_utilization) else 0
+        # Load imbalance: how far the busiest CPU is above the mean, in percent
+        mean_busy = self.cpu_busy.mean() if len(self.cpu_busy) else 0
+        summary["cpu_load_imbalance"] = float((self.cpu_busy.max() / mean_busy - 1) * 100) if mean_busy > 0 else 0
+        summary["cpu_device_utilization"] = cpu_utilization.tolist()
+        summary["io_device_utilization"] = io_utilization.tolist()
+        return summary
 
     def calculate(self):
-        avg_turnaround_time = self.total_turnaround_time / self.jobs_count if self.jobs_count > 0 else 0
-        avg_waiting_time = self.total_waiting_time / self.jobs_count if self.jobs_count > 0 else 0
-        cpu_utilization = (self.cpu_busy_time / self.clock) * 100 if self.clock > 0 else 0
-        return avg_turnaround_time, avg_waiting_time, cpu_utilization
+        summary = self.summary()
+        return summary["avg_turnaround"], summary["avg_waiting"], summary["cpu_utilization"]
@@ -5,28 +5,53 @@ import time
 
 
 class MLFQRichTable:
-    def __init__(self):
-        """Initialize the RichTable for MLFQ live visualization."""
+    def __init__(self, fps=None):
+        """
+        Initialize the RichTable for MLFQ live visualization.
+        With `fps` set, frames are drawn at most that many times per second and
+        ticks in between are not rendered or slowed down.
+        """
         self.console_width = Console().width
-        self.live = Live(self.generate_table([], [], []), refresh_per_second=10)
+        self.frame_interval = 1 / fps if fps else None
+        self.last_frame = float("-inf")
+        self.live = Live(self.generate_table([], [], [], [], []), refresh_per_second=10)
         self.live.start()
         self.queues = []
         self.running_jobs = []
+        self.waiting_jobs = []
+        self.io_jobs = []
         self.terminated_jobs = []
 
-    def update(self, queues, running_jobs, terminated_jobs):
+    def update(self, queues, running_jobs, waiting_jobs, io_jobs, terminated_jobs):
         """Update the internal state for the queues and resources."""
         self.queues = queues
         self.running_jobs = running_jobs
+        self.waiting_jobs = waiting_jobs
+        self.io_jobs = io_jobs
         self.terminated_jobs = terminated_jobs
 
-    def show_tables(self, queues, running_jobs, terminated_jobs):
+    def show_tables(self, queues, running_jobs, waiting_jobs, io_jobs, terminated_jobs):
         """Render and display the updated table in the live view."""
-        self.update(queues, running_jobs, terminated_jobs)
-        self.live.update(self.generate_table(queues, running_jobs, terminated_jobs))
-        time.sleep(0.05)
+        self.update(queues, running_jobs, waiting_jobs, io_jobs, terminated_jobs)
+        self.live.update(self.generate_table(queues, running_jobs, waiting_jobs, io_jobs, terminated_jobs))
+        if self.frame_interval is None:
+            time.sleep(0.05)
 
-    def generate_table(self, queues, running_jobs, terminated_jobs):
+    def frame_due(self):
+        """Whether the next show_tables call should happen; always true when not throttled."""
+        if self.frame_interval is None:
+            return True
+        now = time.perf_counter()
+        if now - self.last_frame < self.frame_interval:
+            return False
+        self.last_frame = now
+        return True
+
+    def close(self):
+        """Stop the live view."""
+        self.live.stop()
+
+    def generate_table(self, queues, running_jobs, waiting_jobs, io_jobs, terminated_jobs):
         """Generate the visualization table."""
         table = Table(show_header=False, expand=True)
         table.add_column("Component", style="bold cyan", width=int(self.console_width * 0.2))
@@ -42,6 +67,12 @@ class MLFQRichTable:
         running_details = "\n".join(running_jobs) if running_jobs else "[None]"
         table.add_row("Running CPUs", running_details, end_section=True)
 
+        # Add the I/O Waiting Queue and Devices
+        waiting_details = ", ".join(waiting_jobs) if waiting_jobs else "[Empty]"
+        table.add_row("Waiting Queue", waiting_details, end_section=True)
+        io_details = "\n".join(io_jobs) if io_jobs else "[None]"
+        table.add_row("I/O Devices", io_details, end_section=True)
+
         # Add Terminated Jobs
         terminated_details = ", ".join(terminated_jobs) if terminated_jobs else "[None]"
         table.add_row("Terminated Jobs", terminated_details, end_section=True)
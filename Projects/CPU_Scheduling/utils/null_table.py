@@ -0,0 +1,14 @@
+class NullTable:
+    """Visualizer for headless runs: never asks for a frame and draws nothing."""
+
+    def show_tables(self, *queues):
+        pass
+
+    def show_message(self, message):
+        pass
+
+    def frame_due(self):
+        return False
+
+    def close(self):
+        pass
@@ -0,0 +1,145 @@
+import time
+from collections import Counter
+
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+# Engine method timed as each phase of the tick loop -> phase name
+PHASES = {
+    "_admit_jobs": "admission",
+    "_dispatch_cpus": "cpu dispatch",
+    "_dispatch_io": "io dispatch",
+    "_process_cpus": "cpu processing",
+    "_process_io": "io processing",
+    "render": "visualization",
+    "_is_finished": "exit check",
+    "_skip_idle_ticks": "idle skip",
+}
+
+
+class PhaseProfiler:
+    """
+    Times each phase of SchedulerEngine.run_simulation and counts the API calls
+    made in each one.
+
+    attach() wraps the engine's phase methods and its API object on that engine
+    instance only, so runs without a profiler pay nothing. Every timed call is
+    also passed to the collectors added with add_collector(), as
+    collector(phase, seconds), for custom aggregation or export.
+    """
+
+    def __init__(self):
+        self.seconds = Counter()  # Phase -> total wall time
+        self.calls = Counter()  # Phase -> number of times it ran
+        self.api_calls = {}  # Phase -> Counter of API method -> calls
+        self.phase = None  # Phase running right now, which API calls are charged to
+        self.collectors = []
+        self.started = None
+        self.stopped = None
+
+    def add_collector(self, collector):
+        """Call `collector(phase, seconds)` after every timed phase."""
+        self.collectors.append(collector)
+
+    def attach(self, engine):
+        """Instrument `engine`'s phase methods and API object."""
+        for method_name, phase in PHASES.items():
+            setattr(engine, method_name, self._timed(phase, getattr(engine, method_name)))
+        engine.api = ProfiledAPI(engine.api, self)
+
+    def _timed(self, phase, method):
+        def timed(*args, **kwargs):
+            if self.started is None:
+                self.started = time.perf_counter()
+            self.phase = phase
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.phase = None
+                self.seconds[phase] += elapsed
+                self.calls[phase] += 1
+                self.stopped = time.perf_counter()
+                for collector in self.collectors:
+                    collector(phase, elapsed)
+        return timed
+
+    def count_api_call(self, method_name):
+        self.api_calls.setdefault(self.phase or "other", Counter())[method_name] += 1
+
+    def summary(self):
+        """
+        Per-phase totals of the run.
+        Returns:
+            dict: Phase -> {"calls", "seconds", "api_calls" (method -> calls)},
+            plus "other" for the time and API calls outside the timed phases
+            (policy ticks, loop and profiling overhead).
+        """
+        phases = {
+            phase: {"calls": self.calls[phase], "seconds": self.seconds[phase], "api_calls": dict(self.api_calls.get(phase, {}))}
+            for phase in PHASES.values()
+        }
+        total = (self.stopped - self.started) if self.started is not None else 0.0
+        phases["other"] = {
+            "calls": 0,
+            "seconds": max(total - sum(self.seconds.values()), 0.0),
+            "api_calls": dict(self.api_calls.get("other", {})),
+        }
+        return phases
+
+    def report(self):
+        """Print the per-phase summary as a table."""
+        summary = self.summary()
+        total = sum(phase["seconds"] for phase in summary.values()) or 1.0
+        table = Table(title="Tick Loop Profile", box=box.SIMPLE)
+        table.add_column("Phase")
+        table.add_column("Calls", justify="right")
+        table.add_column("Total (s)", justify="right")
+        table.add_column("Share", justify="right")
+        table.add_column("us/call", justify="right")
+        table.add_column("API calls")
+        for phase, values in sorted(summary.items(), key=lambda item: item[1]["seconds"], reverse=True):
+            per_call = f"{values['seconds'] / values['calls'] * 1e6:.2f}" if values["calls"] else "-"
+            api_calls = ", ".join(f"{name}: {count}" for name, count in values["api_calls"].items()) or "-"
+            table.add_row(
+                phase,
+                str(values["calls"]),
+                f"{values['seconds']:.4f}",
+                f"{values['seconds'] / total * 100:.1f}%",
+                per_call,
+                api_calls,
+            )
+        Console().print(table)
+
+
+class ProfiledAPI:
+    """Wraps an API backend and charges each method call to the running phase."""
+
+    def __init__(self, api, profiler):
+        self.api = api
+        self.profiler = profiler
+
+    def __getattr__(self, name):
+        attribute = getattr(self.api, name)
+        if not callable(attribute):
+            return attribute
+
+        def counted(*args, **kwargs):
+            self.profiler.count_api_call(name)
+            return attribute(*args, **kwargs)
+        return counted
+
+
+class NullProfiler:
+    """Profiler for runs that are not profiled: instruments nothing."""
+
+    def add_collector(self, collector):
+        pass
+
+    def attach(self, engine):
+        pass
+
+    def report(self):
+        pass
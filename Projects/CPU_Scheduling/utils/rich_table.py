@@ -5,9 +5,15 @@ from rich import box
 import time
 
 class RichTable:
-    def __init__(self):
-        """Initialize the RichTable for live visualization."""
+    def __init__(self, fps=None):
+        """
+        Initialize the RichTable for live visualization.
+        With `fps` set, frames are drawn at most that many times per second and
+        ticks in between are not rendered or slowed down.
+        """
         self.terminal_width = Console().width
+        self.frame_interval = 1 / fps if fps else None
+        self.last_frame = float("-inf")
         self.live = Live(self.generate_table([], [], [], [], []), refresh_per_second=10)
         self.live.start()
         self.ready_queue = []
@@ -28,7 +34,22 @@ class RichTable:
         """Render and display the updated table in the live view."""
         self.update(ready_queue, waiting_queue, running_cpus, io_queue, terminated_jobs)
         self.live.update(self.generate_table(ready_queue, waiting_queue, running_cpus, io_queue, terminated_jobs))
-        time.sleep(0.05)
+        if self.frame_interval is None:
+            time.sleep(0.05)
+
+    def frame_due(self):
+        """Whether the next show_tables call should happen; always true when not throttled."""
+        if self.frame_interval is None:
+            return True
+        now = time.perf_counter()
+        if now - self.last_frame < self.frame_interval:
+            return False
+        self.last_frame = now
+        return True
+
+    def close(self):
+        """Stop the live view."""
+        self.live.stop()
 
     def show_message(self, message):
         """Add a custom message to the visualization."""
@@ -41,10 +62,13 @@ class RichTable:
 
     def make_row(self, queue_name, queue_items):
         """Create a table row for a specific queue."""
-        if isinstance(queue_items, list) and all(isinstance(item, dict) for item in queue_items):
+        if isinstance(queue_items, list) and all(hasattr(item, "job_id") for item in queue_items):
             processes = ", ".join(
-                f"[bold magenta]Job{item['job_id']}[/bold magenta]" for item in queue_items
+                f"[bold magenta]Job{item.job_id}[/bold magenta]" for item in queue_items
             )
+        elif isinstance(queue_items, list) and all(isinstance(item, int) for item in queue_items):
+            # Job ids, as the engine keeps them for terminated jobs
+            processes = ", ".join(f"[bold magenta]Job{job_id}[/bold magenta]" for job_id in queue_items)
         elif isinstance(queue_items, list) and all(isinstance(item, str) for item in queue_items):
             processes = ", ".join(f"[bold blue]{item}[/bold blue]" for item in queue_items)
         else:
@@ -61,9 +85,9 @@ class RichTable:
         table.add_row(
             "[bold yellow]Running CPUs[/bold yellow]",
             ", ".join(
-                f"[bold green]CPU {cpu['cpu_id']} [Job: [bold magenta]{cpu['job']['job_id']}[/bold magenta], Remaining: {cpu['remaining_time']}[/bold green]]"
-                if cpu and cpu.get("job") else f"[dim]CPU {i} [Idle][/dim]"
-                for i, cpu in enumerate(running_cpus)
+                f"[bold green]CPU {i} [Job: [bold magenta]{job.job_id}[/bold magenta], Remaining: {job.remaining_time}[/bold green]]"
+                if job else f"[dim]CPU {i} [Idle][/dim]"
+                for i, job in enumerate(running_cpus)
             ),
             end_section=True,
         )
@@ -71,9 +95,9 @@ class RichTable:
         table.add_row(
             "[bold yellow]I/O Queue[/bold yellow]",
             ", ".join(
-                f"[bold red]I/O {io['io_id']} [Job: [bold magenta]{io['job']['job_id']}[/bold magenta], Remaining: {io['remaining_time']}][/bold red]"
-                if io and io.get("job") else f"[dim]I/O {i} [Idle][/dim]"
-                for i, io in enumerate(io_queue)
+                f"[bold red]I/O {i} [Job: [bold magenta]{job.job_id}[/bold magenta], Remaining: {job.remaining_time}][/bold red]"
+                if job else f"[dim]I/O {i} [Idle][/dim]"
+                for i, job in enumerate(io_queue)
             ),
             end_section=True,
         )
@@ -0,0 +1,157 @@
+import csv
+import struct
+import zlib
+
+import numpy as np
+
+# Job state transitions recorded in a timeline; the binary format stores the index
+EVENTS = ("arrive", "ready", "waiting", "run", "io", "quantum", "preempt", "cpu_done", "io_done", "terminate")
+EVENT_CODES = {name: code for code, name in enumerate(EVENTS)}
+
+# Device a transition happened on; the binary format stores the index
+DEVICES = ("", "cpu", "io")
+DEVICE_CODES = {name: code for code, name in enumerate(DEVICES)}
+
+COLUMNS = ("clock", "device", "device_id", "job_id", "event")
+
+# Binary chunk layout: every chunk stores its row count, then each column as a
+# length-prefixed, zlib-compressed little-endian array with this dtype. Clocks
+# are stored as deltas from the previous row, which are mostly 0 or small.
+MAGIC = b"CPUTL1\n"
+DTYPES = {
+    "clock": np.dtype("<i8"),
+    "device": np.dtype("<u1"),
+    "device_id": np.dtype("<i4"),  # -1 for transitions not tied to a device
+    "job_id": np.dtype("<i8"),
+    "event": np.dtype("<u1"),
+}
+CHUNK_HEADER = struct.Struct("<I")  # Row count, and byte length of each compressed column
+
+
+class TimelineWriter:
+    """
+    Streams the job state transitions of a run to disk.
+
+    Rows are buffered per column and written out every `chunk_rows` rows, so
+    memory stays flat however long the run is. A path ending in .csv gets a
+    readable CSV file; any other path gets the columnar binary format, where
+    each chunk is a row count followed by one compressed array per column.
+    Read either with read_timeline().
+    """
+
+    def __init__(self, path, chunk_rows=65536):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.binary = not path.endswith(".csv")
+        self.columns = {name: [] for name in COLUMNS}
+        self.rows = 0  # Rows written so far, including the buffered ones
+        self.last_clock = 0  # Clock of the last row written, the base of the next chunk's deltas
+        if self.binary:
+            self.file = open(path, "wb")
+            self.file.write(MAGIC)
+        else:
+            self.file = open(path, "w", newline="")
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(COLUMNS)
+
+    def record(self, clock, event, job_id, device="", device_id=-1):
+        """
+        Add one transition.
+        Args:
+            clock (int): Tick of the transition.
+            event (str): One of EVENTS.
+            job_id (int): The job.
+            device (str): "cpu", "io" or "" when the transition is not on a device.
+            device_id (int): Index of the device, -1 when there is none.
+        """
+        columns = self.columns
+        columns["clock"].append(clock)
+        columns["device"].append(device)
+        columns["device_id"].append(device_id)
+        columns["job_id"].append(job_id)
+        columns["event"].append(event)
+        self.rows += 1
+        if len(columns["clock"]) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows as one chunk."""
+        columns = self.columns
+        count = len(columns["clock"])
+        if not count:
+            return
+        if self.binary:
+            self.file.write(CHUNK_HEADER.pack(count))
+            for name in COLUMNS:
+                values = columns[name]
+                if name == "clock":
+                    values = np.diff(np.asarray(values, dtype=DTYPES[name]), prepend=self.last_clock)
+                    self.last_clock = columns["clock"][-1]
+                elif name == "device":
+                    values = [DEVICE_CODES[value] for value in values]
+                elif name == "event":
+                    values = [EVENT_CODES[value] for value in values]
+                packed = zlib.compress(np.asarray(values, dtype=DTYPES[name]).tobytes())
+                self.file.write(CHUNK_HEADER.pack(len(packed)))
+                self.file.write(packed)
+        else:
+            self.writer.writerows(zip(*(columns[name] for name in COLUMNS)))
+        for values in columns.values():
+            values.clear()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+class NullTimeline:
+    """Timeline for runs that do not export one: drops every transition."""
+
+    def record(self, clock, event, job_id, device="", device_id=-1):
+        pass
+
+    def close(self):
+        pass
+
+
+def read_timeline(path):
+    """
+    Load a timeline written by TimelineWriter.
+    Args:
+        path (str): A .csv timeline or a binary one.
+    Returns:
+        dict: One NumPy array per column. "device" and "event" hold the codes
+        indexing DEVICES and EVENTS.
+    """
+    if path.endswith(".csv"):
+        with open(path, newline="") as timeline_file:
+            rows = list(csv.DictReader(timeline_file))
+        return {
+            "clock": np.array([int(row["clock"]) for row in rows], dtype=DTYPES["clock"]),
+            "device": np.array([DEVICE_CODES[row["device"]] for row in rows], dtype=DTYPES["device"]),
+            "device_id": np.array([int(row["device_id"]) for row in rows], dtype=DTYPES["device_id"]),
+            "job_id": np.array([int(row["job_id"]) for row in rows], dtype=DTYPES["job_id"]),
+            "event": np.array([EVENT_CODES[row["event"]] for row in rows], dtype=DTYPES["event"]),
+        }
+
+    chunks = {name: [] for name in COLUMNS}
+    last_clock = 0
+    with open(path, "rb") as timeline_file:
+        if timeline_file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"'{path}' is not a timeline file")
+        while True:
+            header = timeline_file.read(CHUNK_HEADER.size)
+            if not header:
+                break
+            (count,) = CHUNK_HEADER.unpack(header)
+            for name in COLUMNS:
+                (length,) = CHUNK_HEADER.unpack(timeline_file.read(CHUNK_HEADER.size))
+                values = np.frombuffer(zlib.decompress(timeline_file.read(length)), dtype=DTYPES[name])
+                if name == "clock":
+                    values = last_clock + np.cumsum(values)
+                    last_clock = values[-1]
+                chunks[name].append(values)
+    return {
+        name: np.concatenate(arrays) if arrays else np.empty(0, dtype=DTYPES[name])
+        for name, arrays in chunks.items()
+    }
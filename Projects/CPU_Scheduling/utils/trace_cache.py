@@ -0,0 +1,171 @@
+import gzip
+import hashlib
+import json
+import os
+from collections import deque
+
+from .local_api import LocalAPIUtils
+from .workload import WorkloadGenerator, DISTRIBUTION_PARAMS
+
+# Config knobs that shape the generated workload; scheduler-side settings
+# (cpus, ios, quanta, connection options) do not change the trace.
+WORKLOAD_KEYS = (
+    "min_jobs", "max_jobs", "min_bursts", "max_bursts",
+    "min_job_interval", "max_job_interval", "burst_type_ratio",
+    "min_cpu_burst_interval", "max_cpu_burst_interval",
+    "min_io_burst_interval", "max_io_burst_interval",
+    "min_ts_interval", "max_ts_interval", "priority_levels",
+)
+
+# Workload distribution settings; only part of the key when set, so traces
+# recorded with the default uniform distributions keep their file names
+DISTRIBUTION_KEYS = tuple(
+    f"{quantity}_{setting}"
+    for quantity in WorkloadGenerator.QUANTITIES
+    for setting in ("distribution",) + DISTRIBUTION_PARAMS
+)
+
+
+def trace_path(trace_dir, config, seed):
+    """
+    Build the trace file path for a (client_id, seed, config) key.
+    Args:
+        trace_dir (str): Directory holding the trace files.
+        config (dict): The simulation config.
+        seed (int, optional): The session seed.
+    Returns:
+        str: Path of the trace file.
+    """
+    workload = {key: config.get(key) for key in WORKLOAD_KEYS}
+    workload.update({key: config[key] for key in DISTRIBUTION_KEYS if key in config})
+    digest = hashlib.sha1(json.dumps(workload, sort_keys=True).encode()).hexdigest()[:12]
+    return os.path.join(trace_dir, f"{config['client_id']}-{seed}-{digest}.trace.json.gz")
+
+
+class RecordingAPIUtils:
+    """
+    Wraps an API backend and records every response of a session so it can be
+    replayed later with ReplayAPIUtils.
+
+    Arrivals are stored per clock tick and bursts as a per-job list, so a replay
+    serves the same workload to any scheduler regardless of call order.
+    """
+
+    def __init__(self, api, trace_dir):
+        self.api = api
+        self.trace_dir = trace_dir
+        self.trace = None
+        self.path = None
+
+    def __getattr__(self, name):
+        # Expose the wrapped backend's extras (stats, close, ...)
+        return getattr(self.api, name)
+
+    def init_session(self, seed=None):
+        session_data = self.api.init_session(seed=seed)
+        self.path = trace_path(self.trace_dir, self.api.config, seed)
+        self.trace = {
+            "init": {"start_clock": session_data["start_clock"], "time_slice": session_data["time_slice"]},
+            "arrivals": {},
+            "bursts": {},
+            "total_jobs": None,
+        }
+        return session_data
+
+    def _record_burst(self, job_id, burst):
+        if burst:
+            self.trace["bursts"].setdefault(str(job_id), []).append(
+                [burst.get("burst_id"), burst["burst_type"], burst["duration"]]
+            )
+
+    def get_jobs(self, session_id, clock_time):
+        jobs = self.api.get_jobs(session_id, clock_time)
+        if jobs:
+            self.trace["arrivals"][str(clock_time)] = [dict(job) for job in jobs]
+        return jobs
+
+    def get_burst(self, session_id, job_id):
+        burst = self.api.get_burst(session_id, job_id)
+        self._record_burst(job_id, burst)
+        return burst
+
+    def bursts_left(self, session_id, job_id):
+        # Derivable on replay from the remaining recorded bursts
+        return self.api.bursts_left(session_id, job_id)
+
+    def get_bursts(self, session_id, job_ids):
+        bursts = self.api.get_bursts(session_id, job_ids)
+        for job_id, burst in zip(job_ids, bursts):
+            self._record_burst(job_id, burst)
+        return bursts
+
+    def advance_burst(self, session_id, job_id):
+        burst, bursts_left = self.api.advance_burst(session_id, job_id)
+        self._record_burst(job_id, burst)
+        return burst, bursts_left
+
+    def next_bursts(self, session_id, job_ids):
+        bursts = self.api.next_bursts(session_id, job_ids)
+        for job_id, burst in zip(job_ids, bursts):
+            self._record_burst(job_id, burst)
+        return bursts
+
+    def jobs_left(self, session_id):
+        jobs_left = self.api.jobs_left(session_id)
+        self.trace["total_jobs"] = jobs_left
+        return jobs_left
+
+    def save(self):
+        """
+        Write the recorded session to its trace file.
+        Returns:
+            str: Path of the trace file.
+        """
+        os.makedirs(self.trace_dir, exist_ok=True)
+        with gzip.open(self.path, "wt") as trace_file:
+            json.dump(self.trace, trace_file, separators=(",", ":"))
+        return self.path
+
+
+class ReplayAPIUtils(LocalAPIUtils):
+    """
+    Serves a session recorded by RecordingAPIUtils from disk, with no network.
+    """
+
+    def __init__(self, config, trace_dir):
+        super().__init__(config)
+        self.trace_dir = trace_dir
+
+    def init_session(self, seed=None):
+        """
+        Loads the trace recorded for this config and seed as a new session.
+        Args:
+            seed (int, optional): The seed the trace was recorded with.
+        Returns:
+            dict: Contains session_id, start_clock, and time_slice.
+        """
+        path = trace_path(self.trace_dir, self.config, seed)
+        try:
+            with gzip.open(path, "rt") as trace_file:
+                trace = json.load(trace_file)
+        except FileNotFoundError:
+            raise RuntimeError(f"No recorded trace at '{path}'")
+
+        session_id = f"replay-{next(self._session_counter)}"
+        bursts = {
+            int(job_id): deque(
+                {"burst_id": burst_id, "burst_type": burst_type, "duration": duration}
+                for burst_id, burst_type, duration in job_bursts
+            )
+            for job_id, job_bursts in trace["bursts"].items()
+        }
+        arrivals = sorted((int(clock), jobs) for clock, jobs in trace["arrivals"].items())
+        total_jobs = trace["total_jobs"] if trace["total_jobs"] is not None else len(bursts)
+        # A list iterator rather than a generator, so the session can be checkpointed
+        jobs = [
+            (clock, job, bursts.pop(job["job_id"], deque()))
+            for clock, clock_jobs in arrivals
+            for job in clock_jobs
+        ]
+        self._register(session_id, iter(jobs), total_jobs)
+        return {"session_id": session_id, **trace["init"]}
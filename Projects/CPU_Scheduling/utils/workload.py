@@ -0,0 +1,117 @@
+from collections import deque
+
+
+def _uniform(rng, low, high, params):
+    return rng.randint(low, high)
+
+
+def _exponential(rng, low, high, params):
+    # Shifted exponential: never below `low`, mean `mean` (default: middle of the range)
+    mean = params.get("mean", (low + high) / 2)
+    return low + round(rng.expovariate(1 / max(mean - low, 1e-9)))
+
+
+def _pareto(rng, low, high, params):
+    # Heavy-tailed: most values near `low`, a few very large ones; smaller alpha means a heavier tail
+    return round(low * rng.paretovariate(params.get("alpha", 1.5)))
+
+
+def _bimodal(rng, low, high, params):
+    # Mostly values from the configured range, a `long_ratio` share of them scaled up by `long_scale`
+    if rng.random() < params.get("long_ratio", 0.1):
+        scale = params.get("long_scale", 10)
+        return rng.randint(low * scale, high * scale)
+    return rng.randint(low, high)
+
+
+# Distributions selectable per quantity with "<quantity>_distribution"
+DISTRIBUTIONS = {
+    "uniform": _uniform,
+    "exponential": _exponential,
+    "pareto": _pareto,
+    "bimodal": _bimodal,
+}
+
+# Parameters read from "<quantity>_<name>" config keys
+DISTRIBUTION_PARAMS = ("mean", "alpha", "long_ratio", "long_scale")
+
+
+class WorkloadGenerator:
+    """
+    Lazily generates a session's jobs in arrival order.
+
+    The generator is an iterator yielding one (arrival_time, job, bursts)
+    tuple at a time, so a run of millions of jobs only keeps the jobs that
+    have arrived and not finished in memory. Each of the sampled quantities
+    (cpu_burst, io_burst and job_interval) uses its min_/max_ range from the
+    config and the distribution named by "<quantity>_distribution": uniform
+    (the default, a plain randint over the range), exponential, pareto or
+    bimodal, tuned by the "<quantity>_mean", "_alpha", "_long_ratio" and
+    "_long_scale" keys.
+
+    A "pinned_job_ratio" share of the jobs (0 by default) gets an "affinity"
+    pinning it to one CPU, picked from "pinned_cpus" (default: every CPU);
+    per-CPU queues keep pinned jobs on their CPU.
+    """
+
+    # Sampled quantity -> config keys of its range
+    QUANTITIES = {
+        "cpu_burst": ("min_cpu_burst_interval", "max_cpu_burst_interval"),
+        "io_burst": ("min_io_burst_interval", "max_io_burst_interval"),
+        "job_interval": ("min_job_interval", "max_job_interval"),
+    }
+
+    def __init__(self, config, rng, start_clock=0):
+        self.config = config
+        self.rng = rng
+        self.start_clock = start_clock
+        self.samplers = {}
+        for quantity, (low_key, high_key) in self.QUANTITIES.items():
+            name = config.get(f"{quantity}_distribution", "uniform")
+            if name not in DISTRIBUTIONS:
+                raise ValueError(
+                    f"Unsupported {quantity} distribution '{name}'. Supported distributions: {', '.join(DISTRIBUTIONS)}"
+                )
+            params = {
+                param: config[f"{quantity}_{param}"]
+                for param in DISTRIBUTION_PARAMS
+                if f"{quantity}_{param}" in config
+            }
+            self.samplers[quantity] = (DISTRIBUTIONS[name], config[low_key], config[high_key], params)
+        self.total_jobs = rng.randint(config["min_jobs"], config["max_jobs"])
+        self.priority_levels = config.get("priority_levels") or [1]
+        self.pinned_job_ratio = config.get("pinned_job_ratio", 0)
+        self.pinned_cpus = config.get("pinned_cpus") or list(range(config.get("cpus", 1)))
+        self.next_job_id = 1
+        self.arrival_time = start_clock  # Arrival time of the next job
+
+    def sample(self, quantity):
+        sampler, low, high, params = self.samplers[quantity]
+        return sampler(self.rng, low, high, params)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        # Plain iterator state instead of a generator function, so a session
+        # in progress can be pickled into a checkpoint
+        if self.next_job_id > self.total_jobs:
+            raise StopIteration
+        config = self.config
+        rng = self.rng
+        job_id = self.next_job_id
+        arrival_time = self.arrival_time
+        job = {"job_id": job_id, "arrival_time": arrival_time, "priority": rng.choice(self.priority_levels)}
+        if self.pinned_job_ratio and rng.random() < self.pinned_job_ratio:
+            job["affinity"] = rng.choice(self.pinned_cpus)
+
+        bursts = deque()
+        for burst_id in range(1, rng.randint(config["min_bursts"], config["max_bursts"]) + 1):
+            if rng.random() < config["burst_type_ratio"]:
+                bursts.append({"burst_id": burst_id, "burst_type": "CPU", "duration": self.sample("cpu_burst")})
+            else:
+                bursts.append({"burst_id": burst_id, "burst_type": "IO", "duration": self.sample("io_burst")})
+
+        self.next_job_id += 1
+        self.arrival_time += self.sample("job_interval")
+        return arrival_time, job, bursts